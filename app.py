@@ -1,8 +1,18 @@
 # app.py
 import streamlit as st
-import pandas as pd
+import numpy as np
+import os
 from datetime import datetime
-from data_generator import generate_stock_universe
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from export import EXPORT_FORMATS, export_buffer
+from incremental_scan import IncrementalScan
+from market_feed import SharedFeed
+from profiler import Profiler
+from ranking import RANKINGS, Ranker
+from scan_cache import ScanCache, scan_key
+from screens import SCREENS, run_screens
+from shared_universe import SharedUniverse
+from sector_aggregates import SectorAggregates
 from visualizations import (
     create_heatmap_chart,
     create_scatter_chart,
@@ -30,7 +40,7 @@ st.markdown(
         <div>
             <h2 style="margin: 0; color: white;">📊 52-Week Low Stock Scanner</h2>
             <p style="margin: 0.5rem 0 0 0; opacity: 0.9;">
-                Scan 500+ stocks for potential buying opportunities at 52-week lows
+                Scan real NYSE/NASDAQ stocks for potential buying opportunities at 52-week lows
             </p>
         </div>
         <div style="background: rgba(255,255,255,0.1); padding: 0.5rem 1rem; border-radius: 8px;">
@@ -43,9 +53,120 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
+# ========== PROFILING ==========
+# Spans are only recorded when the sidebar panel is on or SCANNER_PROFILE is set
+profiler = Profiler(
+    enabled=st.session_state.get("show_perf", False)
+    or os.environ.get("SCANNER_PROFILE", "") not in ("", "0")
+)
+
 # ========== LOAD DATA ==========
-with st.spinner("📊 Loading stock universe..."):
-    df = generate_stock_universe()
+# Every real ticker once, no synthetic padding
+UNIVERSE = dict(n_stocks=None, seed=42, compact=True)
+
+
+@st.cache_resource(show_spinner=False)
+def get_shared_universe():
+    """The indexed universe, memory-mapped once per host
+
+    Every worker process attaches to the same published file, and every
+    session reads the same frame and indexes; nothing may write to them,
+    and scans return new frames for their "Near Low" column. A newly
+    published version is picked up within a second.
+    """
+    return SharedUniverse.attach_or_publish(**UNIVERSE)
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def get_universe_stats(version, _scanner):
+    """Whole-universe sector stats for the overview, shared like the universe"""
+    return SectorAggregates.from_scanner(_scanner).update(np.arange(len(_scanner)), 5)
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def get_ranker(version, ranking, _universe):
+    """Ranker for a named ranking, scaled to the universe's column spreads"""
+    return Ranker.from_universe(_universe, RANKINGS[ranking])
+
+
+@st.cache_resource
+def get_scan_cache():
+    """One scan result cache shared by every session on this server"""
+    return ScanCache()
+
+
+@st.cache_resource
+def get_live_feed():
+    """Replay feed shared by every session, running while any session has it on"""
+    return SharedFeed(lambda: get_shared_universe().scanner().universe)
+
+
+def toggle_live_feed():
+    """Join the shared feed, or leave it so the last one out stops it"""
+    session = get_script_run_ctx().session_id
+    if st.session_state.live_feed:
+        get_live_feed().subscribe(session)
+    else:
+        get_live_feed().unsubscribe(session)
+
+
+TOP_PAGE_SIZE = 20
+SCREEN_ROWS = 50
+
+# Display formats for result tables; the underlying columns stay numeric
+RESULT_COLUMN_CONFIG = {
+    "Current Price": st.column_config.NumberColumn(format="$%.2f"),
+    "% From Low": st.column_config.NumberColumn(format="%.1f"),
+    "52W Low": st.column_config.NumberColumn(format="$%.2f"),
+    "52W High": st.column_config.NumberColumn(format="$%.2f"),
+    "Market Cap (B)": st.column_config.NumberColumn(format="$%.0fB"),
+    "Volume (M)": st.column_config.NumberColumn(format="%.1f"),
+}
+
+CHART_VIEWS = [
+    "📊 Sector Heatmap",
+    "📈 Market Cap vs % From Low",
+    "🏭 Sector Breakdown",
+    "Hide charts",
+]
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def cached_figure(kind, scan, threshold, _frame):
+    """Build a figure once per scan
+
+    ``scan`` is the scan cache key (universe version plus filters, threshold
+    included), which fully determines the filtered data, so it stands in for
+    a hash of ``_frame`` without touching its rows.
+    """
+    if kind == "heatmap":
+        return create_heatmap_chart(_frame)
+    if kind == "scatter":
+        return create_scatter_chart(_frame, threshold)
+    return create_sector_charts(_frame)
+
+
+with st.spinner("📊 Loading stock universe..."), profiler.span("universe load"):
+    # One read-only universe per host; sessions only hold their own state
+    scanner = get_shared_universe().scanner()
+    df = scanner.universe
+    universe_stats = get_universe_stats(scanner.version, scanner)
+    # A per-session store that follows this session's filters incrementally
+    if st.session_state.get("sector_stats_version") != scanner.version:
+        st.session_state.sector_stats = SectorAggregates.from_scanner(scanner)
+        st.session_state.sector_stats_version = scanner.version
+
+    # Live quotes re-price the same rows; scans then follow only changed rows
+    live_feed = (
+        get_live_feed().subscribe(get_script_run_ctx().session_id)
+        if st.session_state.get("live_feed")
+        else None
+    )
+    if live_feed is not None:
+        feed_version, df = live_feed.snapshot()
+        universe_stats = SectorAggregates.from_scanner(
+            scanner, df["% From Low"].to_numpy()
+        ).update(np.arange(len(df)), 5)
 
 # ========== SIDEBAR FILTERS ==========
 with st.sidebar:
@@ -59,10 +180,27 @@ with st.sidebar:
         step=0.5,
     )
 
-    sectors = sorted(df["Sector"].unique())
+    sectors = scanner.sectors
     selected_sectors = st.multiselect(
         "Filter by sector:", options=sectors, default=sectors
     )
+    # Empty means every industry / exchange
+    selected_industries = st.multiselect(
+        "Filter by industry:",
+        options=scanner.categories("Industry"),
+        placeholder="All industries",
+        key="industry_filter",
+    )
+    selected_exchanges = st.multiselect(
+        "Filter by exchange:",
+        options=scanner.categories("Exchange"),
+        placeholder="All exchanges",
+        key="exchange_filter",
+    )
+    category_filters = {
+        "industries": selected_industries or None,
+        "exchanges": selected_exchanges or None,
+    }
 
     min_cap, max_cap = st.slider(
         "Market Cap Range (Billions):",
@@ -76,8 +214,13 @@ with st.sidebar:
         "Minimum Daily Volume (Millions):", min_value=0.0, value=5.0, step=5.0
     )
 
+    ranking = st.selectbox("Rank near-low stocks by:", list(RANKINGS), key="ranking")
+
     scan_clicked = st.button(
-        "🚀 Run 52-Week Low Scan", type="primary", use_container_width=True
+        "🚀 Run 52-Week Low Scan",
+        type="primary",
+        use_container_width=True,
+        key="run_scan",
     )
 
     st.divider()
@@ -89,20 +232,41 @@ with st.sidebar:
         "Price Range",
         f"${df['Current Price'].min():.0f}-${df['Current Price'].max():.0f}",
     )
+    cache_stats = get_scan_cache().stats()
+    st.caption(
+        f"Scan cache: {cache_stats['hits']} hits • {cache_stats['misses']} misses • "
+        f"{cache_stats['entries']} cached"
+    )
+    st.toggle(
+        "📡 Live quotes (local replay)", key="live_feed", on_change=toggle_live_feed
+    )
+    if live_feed is not None:
+        feed_stats = live_feed.metrics()
+        st.caption(
+            f"Feed: {feed_stats['ticks_per_sec']:,.0f} ticks/s • "
+            f"lag {feed_stats['lag_ms']:.0f} ms • "
+            f"queue {feed_stats['queue_depth']}/{feed_stats['queue_high_water']} peak"
+        )
+    st.checkbox("⏱️ Show performance panel", key="show_perf")
 
 # ========== MAIN APP LOGIC ==========
-if not scan_clicked:
+# Keep showing results after the first scan so chart/section widgets and
+# filter changes rerun the scan instead of dropping back to the welcome page
+if scan_clicked:
+    st.session_state.scan_active = True
+show_results = st.session_state.get("scan_active", False)
+
+if not show_results:
     # Welcome screen
     col1, col2 = st.columns([2, 1])
 
     with col1:
         st.info("👈 **Configure your scan in the sidebar and click 'Run Scan'**")
 
-        st.markdown(
-            """
+        st.markdown(f"""
             ### 🎯 What This Scanner Does:
             
-            This tool scans **500+ real stocks** across all major sectors to find:
+            This tool scans **{len(df):,} real stocks** across all major sectors to find:
             
             - ✅ **Stocks trading near 52-week lows** - potential buying opportunities
             - ✅ **Sector-level trends** - which industries are under pressure
@@ -110,22 +274,21 @@ if not scan_clicked:
             - ✅ **Visual insights** - heatmaps and distributions
             
             **Perfect for:** Value investors, contrarian strategies, market analysis
-            """
-        )
+            """)
 
     with col2:
         st.subheader("📊 Sample Findings")
 
         # Show a few near-low stocks as example
-        sample_near_low = df.nsmallest(5, "% From Low")
+        sample_near_low = Ranker().top(df, 5)
 
         for _, row in sample_near_low.iterrows():
             st.markdown(
                 f"""
             <div style="background: #FEF2F2; padding: 0.75rem; border-radius: 8px; margin-bottom: 0.5rem;">
                 <strong>{row['Symbol']}</strong> • {row['Sector']}<br>
-                <span style="color: #EF4444; font-weight: bold;">{row['% From Low']}% from low</span><br>
-                <small>${row['Current Price']} • ${row['Market Cap (B)']}B cap</small>
+                <span style="color: #EF4444; font-weight: bold;">{row['% From Low']:.1f}% from low</span><br>
+                <small>${row['Current Price']:.2f} • ${row['Market Cap (B)']:.0f}B cap</small>
             </div>
             """,
                 unsafe_allow_html=True,
@@ -142,29 +305,93 @@ if not scan_clicked:
         st.metric("Total Stocks", f"{len(df):,}")
 
     with col2:
-        avg_from_low = df["% From Low"].mean()
+        avg_from_low = universe_stats.overall_mean
         st.metric("Avg % From Low", f"{avg_from_low:.1f}%")
 
     with col3:
-        stocks_below_5pct = len(df[df["% From Low"] <= 5])
+        stocks_below_5pct = universe_stats.total_near
         st.metric("Within 5% of Low", stocks_below_5pct)
 
     with col4:
-        sector_count = len(df["Sector"].unique())
+        sector_count = int((universe_stats.count > 0).sum())
         st.metric("Sectors", sector_count)
 
 else:
     # ========== RUN SCAN ==========
-    with st.spinner(f"🔍 Scanning {len(df):,} stocks..."):
-        filtered_df = df[
-            (df["Sector"].isin(selected_sectors))
-            & (df["Market Cap (B)"] >= min_cap)
-            & (df["Market Cap (B)"] <= max_cap)
-            & (df["Volume (M)"] >= min_volume)
-        ].copy()
+    with st.spinner(f"🔍 Scanning {len(df):,} stocks..."), profiler.span(
+        "scan (filter + sort)"
+    ):
+        if live_feed is None:
+            scan_cache = get_scan_cache()
+            current_scan = scan_key(
+                scanner.version,
+                selected_sectors,
+                min_cap,
+                max_cap,
+                min_volume,
+                threshold,
+                **category_filters,
+            )
+            filtered_df, near_low_df = scan_cache.get_or_compute(
+                current_scan,
+                lambda: scanner.scan(
+                    selected_sectors,
+                    min_cap,
+                    max_cap,
+                    min_volume,
+                    threshold,
+                    **category_filters,
+                ),
+            )
+        else:
+            # The session's scan is patched with the rows the feed changed
+            # since it last looked, and only rebuilt when the filters change
+            current_scan = scan_key(
+                ("live", live_feed.id, feed_version),
+                selected_sectors,
+                min_cap,
+                max_cap,
+                min_volume,
+                threshold,
+                **category_filters,
+            )
+            live_scan = st.session_state.get("live_scan")
+            # A restarted feed counts versions from zero again
+            if (
+                live_scan is None
+                or live_scan.filters != current_scan[1:]
+                or st.session_state.get("live_scan_feed") != live_feed.id
+            ):
+                live_scan = IncrementalScan.from_scanner(
+                    scanner,
+                    df,
+                    selected_sectors,
+                    min_cap,
+                    max_cap,
+                    min_volume,
+                    threshold,
+                    version=feed_version,
+                    **category_filters,
+                )
+                st.session_state.live_scan = live_scan
+                st.session_state.live_scan_feed = live_feed.id
+            elif live_scan.version != feed_version:
+                live_scan.update(
+                    df, live_feed.changed_since(live_scan.version), feed_version
+                )
+            filtered_df, near_low_df = live_scan.results(df)
 
-        filtered_df["Near Low"] = filtered_df["% From Low"] <= threshold
-        near_low_df = filtered_df[filtered_df["Near Low"]].sort_values("% From Low")
+    with profiler.span("sector aggregates"):
+        # filtered_df keeps universe row ids as its index, in order
+        if live_feed is None:
+            sector_agg = st.session_state.sector_stats.update(
+                filtered_df.index.to_numpy(), threshold
+            )
+        else:
+            sector_agg = SectorAggregates.from_scanner(
+                scanner, df["% From Low"].to_numpy()
+            ).update(filtered_df.index.to_numpy(), threshold)
+        sector_stats = sector_agg.frame()
 
     # ========== DISPLAY RESULTS ==========
     st.success(
@@ -175,88 +402,126 @@ else:
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        st.metric("Stocks Scanned", f"{len(filtered_df):,}")
+        st.metric("Stocks Scanned", f"{sector_agg.total_count:,}")
 
     with col2:
-        st.metric("Near 52-Week Lows", len(near_low_df))
+        st.metric("Near 52-Week Lows", sector_agg.total_near)
 
     with col3:
-        if len(near_low_df) > 0:
-            closest_pct = near_low_df["% From Low"].min()
+        if sector_agg.total_near > 0:
+            closest_pct = sector_agg.overall_min
             st.metric("Closest to Low", f"{closest_pct:.1f}%")
         else:
             st.metric("Closest to Low", "N/A")
 
     with col4:
-        avg_from_low = filtered_df["% From Low"].mean()
+        avg_from_low = sector_agg.overall_mean
         st.metric("Market Avg", f"{avg_from_low:.1f}%")
 
     # ========== DISPLAY STOCK RESULTS ==========
     if len(near_low_df) > 0:
-        st.subheader(f"🎯 Top {min(20, len(near_low_df))} Stocks Near 52-Week Lows")
-
-        # Display top stocks
-        top_stocks = near_low_df.head(20)
-
-        for idx, row in top_stocks.iterrows():
-            col1, col2, col3, col4 = st.columns([1, 2, 2, 1])
-
-            with col1:
-                st.markdown(f"**{row['Symbol']}**")
-                # COMPANY NAME SHOWS HERE
-                st.caption(f"{row['Name']}")
-                st.caption(row["Sector"])
+        n_pages = -(-len(near_low_df) // TOP_PAGE_SIZE)
+        if st.session_state.get("top_page", 1) > n_pages:
+            st.session_state.top_page = 1
+        page = st.session_state.get("top_page", 1)
+        first = (page - 1) * TOP_PAGE_SIZE
+
+        if page == 1:
+            st.subheader(
+                f"🎯 Top {min(TOP_PAGE_SIZE, len(near_low_df))} Stocks Near 52-Week Lows"
+            )
+        else:
+            st.subheader(
+                f"🎯 Stocks Near 52-Week Lows: #{first + 1}-"
+                f"{min(first + TOP_PAGE_SIZE, len(near_low_df))}"
+            )
 
-            with col2:
-                progress = row["% From Low"] / threshold * 100
-                st.progress(
-                    min(100, progress) / 100, text=f"{row['% From Low']:.1f}% from low"
+        # One dataframe element per page instead of a dozen elements per stock;
+        # only the rows up to this page are selected and ordered
+        with profiler.span("top-N table"):
+            ranker = get_ranker(scanner.version, ranking, df)
+            st.dataframe(
+                ranker.top(near_low_df, first + TOP_PAGE_SIZE).iloc[first:],
+                column_order=[
+                    "Symbol",
+                    "Name",
+                    "Sector",
+                    "% From Low",
+                    "Current Price",
+                    "52W Low",
+                    "52W High",
+                    "Market Cap (B)",
+                ],
+                column_config={
+                    **RESULT_COLUMN_CONFIG,
+                    "% From Low": st.column_config.ProgressColumn(
+                        "% From Low",
+                        format="%.1f%%",
+                        min_value=0.0,
+                        max_value=max(threshold, 0.1),
+                    ),
+                    "Market Cap (B)": st.column_config.NumberColumn(
+                        "Cap", format="$%.0fB"
+                    ),
+                },
+                hide_index=True,
+                use_container_width=True,
+            )
+            if n_pages > 1:
+                st.number_input(
+                    f"Page (of {n_pages})",
+                    min_value=1,
+                    max_value=n_pages,
+                    step=1,
+                    key="top_page",
                 )
 
-            with col3:
-                st.markdown(f"**${row['Current Price']:.2f}**")
-                st.caption(f"Range: ${row['52W Low']:.2f}-${row['52W High']:.2f}")
-
-            with col4:
-                st.metric("Cap", f"${row['Market Cap (B)']:.0f}B")
-
-            st.divider()
+        # ========== VISUALIZATIONS ==========
+        # Only the selected section is built; figures are cached per scan
+        chart_view = st.radio(
+            "Visualizations:",
+            CHART_VIEWS,
+            horizontal=True,
+            key="chart_view",
+        )
 
-        # ========== VISUALIZATION 1: HEATMAP ==========
-        st.subheader("📊 Sector Heatmap")
-        heatmap_fig = create_heatmap_chart(filtered_df)
-        st.plotly_chart(heatmap_fig, use_container_width=True)
+        if chart_view == "📊 Sector Heatmap":
+            st.subheader("📊 Sector Heatmap")
+            with profiler.span("heatmap chart"):
+                heatmap_fig = cached_figure(
+                    "heatmap", current_scan, threshold, sector_stats
+                )
+                st.plotly_chart(heatmap_fig, use_container_width=True)
 
-        # ========== VISUALIZATION 2: SCATTER PLOT ==========
-        st.subheader("📈 Market Cap vs % From Low")
-        scatter_fig = create_scatter_chart(filtered_df, threshold)
-        st.plotly_chart(scatter_fig, use_container_width=True)
+        elif chart_view == "📈 Market Cap vs % From Low":
+            st.subheader("📈 Market Cap vs % From Low")
+            with profiler.span("scatter chart"):
+                scatter_fig = cached_figure(
+                    "scatter", current_scan, threshold, filtered_df
+                )
+                st.plotly_chart(scatter_fig, use_container_width=True)
 
-        # ========== VISUALIZATION 3: SECTOR BREAKDOWN ==========
-        st.subheader("🏭 Sector Breakdown")
-        bar_fig, pie_fig = create_sector_charts(near_low_df)
-        col1, col2 = st.columns(2)
-        with col1:
-            st.plotly_chart(bar_fig, use_container_width=True)
-        with col2:
-            st.plotly_chart(pie_fig, use_container_width=True)
+        elif chart_view == "🏭 Sector Breakdown":
+            st.subheader("🏭 Sector Breakdown")
+            with profiler.span("sector charts"):
+                bar_fig, pie_fig = cached_figure(
+                    "sectors", current_scan, threshold, sector_stats
+                )
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.plotly_chart(bar_fig, use_container_width=True)
+                with col2:
+                    st.plotly_chart(pie_fig, use_container_width=True)
 
         # ========== DATA TABLE ==========
         with st.expander("📋 View All Near-Low Stocks", expanded=False):
-            display_df = near_low_df.copy()
-            display_df["Current Price"] = display_df["Current Price"].apply(
-                lambda x: f"${x:.2f}"
-            )
-            display_df["52W Low"] = display_df["52W Low"].apply(lambda x: f"${x:.2f}")
-            display_df["52W High"] = display_df["52W High"].apply(lambda x: f"${x:.2f}")
-            display_df["Market Cap (B)"] = display_df["Market Cap (B)"].apply(
-                lambda x: f"${x:.0f}B"
-            )
-
-            # COMPANY NAME INCLUDED IN TABLE
-            st.dataframe(
-                display_df[
-                    [
+            # Formatting happens in the browser; the frame is neither copied
+            # nor stringified, so its columns still sort numerically
+            with profiler.span("table formatting"):
+                # COMPANY NAME INCLUDED IN TABLE
+                st.dataframe(
+                    near_low_df,
+                    column_order=[
                         "Symbol",
                         "Name",
                         "Sector",
@@ -266,26 +531,58 @@ else:
                         "52W High",
                         "Market Cap (B)",
                         "Volume (M)",
-                    ]
-                ],
-                use_container_width=True,
-                height=400,
-            )
+                    ],
+                    column_config=RESULT_COLUMN_CONFIG,
+                    hide_index=True,
+                    use_container_width=True,
+                    height=400,
+                )
 
-            # Download button
-            csv = near_low_df.to_csv(index=False)
-            st.download_button(
-                label="📥 Download Results as CSV",
-                data=csv,
-                file_name=f"52_week_low_stocks_{datetime.now().strftime('%Y%m%d')}.csv",
-                mime="text/csv",
+            # Download: the file is only encoded when someone asks for it
+            export_label = st.radio(
+                "Export format:",
+                [label for label, _ in EXPORT_FORMATS.values()],
+                horizontal=True,
+                key="export_fmt",
+            )
+            export_fmt = next(
+                fmt
+                for fmt, (label, _) in EXPORT_FORMATS.items()
+                if label == export_label
             )
+            export_key = (current_scan, export_fmt)
+            prepared = st.session_state.get("export")
+            if prepared is not None and prepared[0] != export_key:
+                # Filters or format changed; drop the stale file
+                del st.session_state["export"]
+                prepared = None
+
+            if prepared is None:
+                if st.button("📦 Prepare download", key="prepare_export"):
+                    with profiler.span("export"):
+                        prepared = (export_key, export_buffer(near_low_df, export_fmt))
+                    st.session_state.export = prepared
+
+            if prepared is not None:
+                label, mime = EXPORT_FORMATS[export_fmt]
+                # Streamlit keeps its own copy to serve; once the file has
+                # been downloaded this session's buffer is dropped
+                downloaded = st.download_button(
+                    label=f"📥 Download Results as {label}",
+                    data=prepared[1],
+                    file_name=(
+                        f"52_week_low_stocks_{datetime.now().strftime('%Y%m%d')}"
+                        f".{export_fmt}"
+                    ),
+                    mime=mime,
+                )
+                if downloaded:
+                    del st.session_state["export"]
 
         # ========== INSIGHTS ==========
         with st.expander("🤖 AI-Powered Insights", expanded=True):
             if len(near_low_df) > 10:
-                st.markdown(
-                    f"""
+                st.markdown(f"""
                 **📊 Market Analysis:**
                 - Found **{len(near_low_df)} stocks** ({len(near_low_df)/len(filtered_df)*100:.1f}% of scanned) near 52-week lows
                 - Average distance from low: **{near_low_df['% From Low'].mean():.1f}%**
@@ -300,8 +597,7 @@ else:
                 - Check company fundamentals for near-low stocks
                 - Consider dollar-cost averaging into quality names
                 - Monitor for potential sector rotation
-                """
-                )
+                """)
             else:
                 st.info(
                     f"Only {len(near_low_df)} stocks found near lows. Market may be in an uptrend or consider adjusting your threshold."
@@ -313,41 +609,78 @@ else:
         )
 
         # Suggest adjustments
-        st.info(
-            """
+        st.info("""
         **💡 Try adjusting your filters:**
         - Increase the threshold percentage
         - Include more sectors
         - Adjust market cap range
         - Lower volume requirements
-        """
-        )
+        """)
 
         # Show closest candidates
-        closest_candidates = filtered_df.nsmallest(10, "% From Low")
+        closest_candidates = Ranker().top(filtered_df, 10)
         if len(closest_candidates) > 0:
             st.subheader("📊 Closest Candidates")
             st.dataframe(
-                closest_candidates[
-                    [
-                        "Symbol",
-                        "Name",
-                        "Sector",
-                        "Current Price",
-                        "% From Low",
-                        "Market Cap (B)",
-                    ]
+                closest_candidates,
+                column_order=[
+                    "Symbol",
+                    "Name",
+                    "Sector",
+                    "Current Price",
+                    "% From Low",
+                    "Market Cap (B)",
                 ],
+                column_config=RESULT_COLUMN_CONFIG,
                 use_container_width=True,
             )
 
+    # ========== OTHER SCREENS ==========
+    # All screens run in one pass over the rows that passed the filters above
+    with st.expander("🔀 Other Screens", expanded=False):
+        with profiler.span("screens"):
+            screen_hits = run_screens(
+                df,
+                filtered_df.index.to_numpy(),
+                low_threshold=threshold,
+                high_threshold=threshold,
+            )
+        for col, (name, label) in zip(st.columns(len(SCREENS)), SCREENS.items()):
+            col.metric(label, f"{len(screen_hits[name].rows):,}")
+
+        screen_label = st.radio(
+            "Show screen:", list(SCREENS.values()), horizontal=True, key="screen_view"
+        )
+        screen_name = next(n for n, label in SCREENS.items() if label == screen_label)
+        st.dataframe(
+            df.take(screen_hits[screen_name].top(SCREEN_ROWS)),
+            column_order=[
+                "Symbol",
+                "Name",
+                "Sector",
+                "Current Price",
+                "% From Low",
+                "% From High",
+                "52W Low",
+                "52W High",
+                "Market Cap (B)",
+            ],
+            column_config={
+                **RESULT_COLUMN_CONFIG,
+                "% From High": st.column_config.NumberColumn(format="%.1f"),
+            },
+            hide_index=True,
+            use_container_width=True,
+        )
+        st.caption(f"Best {SCREEN_ROWS} per screen; thresholds follow the slider.")
+
 # ========== FOOTER ==========
 st.divider()
 st.markdown(
-    """
+    f"""
 <div style="text-align: center; color: #6B7280; padding: 1rem;">
     <p>
-        <strong>📊 Stock Universe:</strong> 500+ sample stocks across 6 sectors • 
+        <strong>📊 Stock Universe:</strong> {len(df):,} sample stocks across {len(scanner.sectors)} sectors • 
         <strong>📅 Data:</strong> December 2024 sample data •
         <strong>🎯 Purpose:</strong> Architecture demonstration
     </p>
@@ -359,3 +692,15 @@ st.markdown(
 """,
     unsafe_allow_html=True,
 )
+
+# ========== PERFORMANCE PANEL ==========
+if profiler.enabled:
+    profiler.emit(scan=show_results, universe_rows=len(df))
+
+    if st.session_state.get("show_perf"):
+        with st.sidebar:
+            st.subheader("⏱️ Performance")
+            st.dataframe(
+                profiler.frame().round(2), hide_index=True, use_container_width=True
+            )
+            st.caption(f"Total run: {profiler.total * 1e3:.0f} ms")
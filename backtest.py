@@ -0,0 +1,225 @@
+# backtest.py
+"""Vectorized backtest of the near-low scan over generated daily price panels
+
+Example:
+    python backtest.py --n-stocks 2000 --years 5 --threshold 5 --workers 4
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data_generator import N_STOCKS_HELP
+from export import EXPORT_FORMATS, write_frame
+from price_history import (
+    TRADING_DAYS_PER_YEAR,
+    generate_universe_with_history,
+    rolling_min,
+)
+from scanner import Scanner
+
+HORIZONS = (1, 5, 20)
+
+# Evaluation days handed to one worker task
+CHUNK_DAYS = 126
+
+
+def eligible_columns(
+    universe, sectors=None, min_cap=None, max_cap=None, min_volume=None
+):
+    """Boolean mask of the panel columns passing the app's sector/cap/volume filters
+
+    These filters use the universe's static attributes through the same
+    Scanner the app uses, so only the near-low test varies by date.
+    """
+    rows = Scanner(universe).filter_rows(sectors, min_cap, max_cap, min_volume)
+    mask = np.zeros(len(universe), dtype=bool)
+    mask[rows] = True
+    return mask
+
+
+def _window_stats(closes, eligible, threshold, window, horizons, n_eval):
+    """Per-date signal counts and forward-return sums for one block of days
+
+    ``closes`` holds ``window - 1`` warm-up rows, then the ``n_eval`` rows
+    being evaluated, then up to ``max(horizons)`` rows of look-ahead.
+    """
+    warm = window - 1
+    closes = np.asarray(closes, dtype=np.float64)
+    lows = rolling_min(closes[: warm + n_eval], window)[warm:]
+    today = closes[warm : warm + n_eval]
+
+    # Rounded like the universe's % From Low column the app filters on
+    from_low = np.round((today - lows) / lows * 100, 1)
+    signal = (from_low <= threshold) & eligible
+
+    out = {"signals": signal.sum(axis=1)}
+    for h in horizons:
+        ahead = np.full_like(today, np.nan)
+        available = max(0, min(n_eval, len(closes) - warm - h))
+        ahead[:available] = closes[warm + h : warm + h + available]
+        returns = ahead / today - 1
+        hit = signal & np.isfinite(returns)
+        out[f"count_{h}"] = hit.sum(axis=1)
+        out[f"sum_{h}"] = np.where(hit, returns, 0.0).sum(axis=1)
+        out[f"wins_{h}"] = (hit & (returns > 0)).sum(axis=1)
+    return out
+
+
+def _blocks(n_days, window, chunk_days):
+    """``(start, stop)`` row ranges of evaluation days, from the first full window"""
+    first = window - 1
+    for start in range(first, n_days, chunk_days):
+        yield start, min(start + chunk_days, n_days)
+
+
+def run_backtest(
+    closes,
+    dates,
+    universe,
+    sectors=None,
+    min_cap=None,
+    max_cap=None,
+    min_volume=None,
+    threshold=5.0,
+    window=TRADING_DAYS_PER_YEAR,
+    horizons=HORIZONS,
+    workers=None,
+    chunk_days=CHUNK_DAYS,
+):
+    """Replay the near-low scan on every date of a closes panel
+
+    ``closes`` is ``(n_days, n_symbols)`` with one column per universe row.
+    A symbol is selected on a date when it passes the static filters and its
+    close is within ``threshold`` percent of its trailing ``window``-day low;
+    dates before the first full window are skipped. Dates are split into
+    blocks of ``chunk_days`` that run on a process pool, each block carrying
+    its own warm-up and look-ahead rows.
+
+    Returns one row per date with the number of signals and, per horizon,
+    the mean forward return (%), the win rate (%) and how many signals had
+    that much history left.
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    n_days = closes.shape[0]
+    eligible = eligible_columns(universe, sectors, min_cap, max_cap, min_volume)
+    ahead = max(horizons)
+
+    tasks = [
+        (
+            closes[start - window + 1 : min(stop + ahead, n_days)],
+            eligible,
+            threshold,
+            window,
+            tuple(horizons),
+            stop - start,
+        )
+        for start, stop in _blocks(n_days, window, chunk_days)
+    ]
+    if not tasks:
+        raise ValueError(f"Need at least {window} days of history, got {n_days}")
+
+    if workers == 1 or len(tasks) == 1:
+        parts = [_window_stats(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            parts = list(pool.map(_window_stats, *zip(*tasks)))
+
+    stats = {key: np.concatenate([p[key] for p in parts]) for key in parts[0]}
+    return _daily_frame(stats, pd.Index(dates[window - 1 :], name="Date"), horizons)
+
+
+def _daily_frame(stats, index, horizons):
+    columns = {"Signals": stats["signals"]}
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for h in horizons:
+            count = stats[f"count_{h}"]
+            columns[f"Fwd {h}D Return (%)"] = stats[f"sum_{h}"] / count * 100
+            columns[f"Fwd {h}D Win Rate (%)"] = stats[f"wins_{h}"] / count * 100
+            columns[f"Fwd {h}D Count"] = count
+    return pd.DataFrame(columns, index=index)
+
+
+def summarize(daily, horizons=HORIZONS):
+    """Signal-weighted averages over the whole backtest, one row per horizon"""
+    rows = []
+    for h in horizons:
+        count = daily[f"Fwd {h}D Count"]
+        total = count.sum()
+
+        def weighted(column):
+            if not total:
+                return np.nan
+            return float((daily[column].fillna(0) * count).sum() / total)
+
+        rows.append(
+            {
+                "Horizon (days)": h,
+                "Signals": int(total),
+                "Mean Return (%)": weighted(f"Fwd {h}D Return (%)"),
+                "Win Rate (%)": weighted(f"Fwd {h}D Win Rate (%)"),
+                "Days With Signals": int((count > 0).sum()),
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n-stocks", type=int, default=None, help=N_STOCKS_HELP)
+    parser.add_argument("--years", type=float, default=3.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--threshold", type=float, default=5.0)
+    parser.add_argument(
+        "--sectors", help="Comma-separated sectors to include (default: all)"
+    )
+    parser.add_argument("--min-cap", type=float, default=10.0)
+    parser.add_argument("--max-cap", type=float, default=200.0)
+    parser.add_argument("--min-volume", type=float, default=5.0)
+    parser.add_argument("--horizons", type=int, nargs="+", default=list(HORIZONS))
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-days", type=int, default=CHUNK_DAYS)
+    parser.add_argument("--out", type=Path, help="Write the per-date results here")
+    parser.add_argument("--format", choices=list(EXPORT_FORMATS), default="csv")
+    args = parser.parse_args(argv)
+
+    n_days = int(args.years * TRADING_DAYS_PER_YEAR)
+    start = time.perf_counter()
+    universe, dates, closes = generate_universe_with_history(
+        n_stocks=args.n_stocks, n_days=n_days, seed=args.seed
+    )
+    generated = time.perf_counter() - start
+
+    start = time.perf_counter()
+    daily = run_backtest(
+        closes,
+        dates,
+        universe,
+        sectors=args.sectors.split(",") if args.sectors else None,
+        min_cap=args.min_cap,
+        max_cap=args.max_cap,
+        min_volume=args.min_volume,
+        threshold=args.threshold,
+        horizons=args.horizons,
+        workers=args.workers,
+        chunk_days=args.chunk_days,
+    )
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"Backtested {len(daily)} days x {len(universe):,} stocks in {elapsed:.2f}s "
+        f"(history generated in {generated:.2f}s)"
+    )
+    print(summarize(daily, args.horizons).round(3).to_string(index=False))
+    if args.out:
+        write_frame(daily.reset_index(), args.out, args.format)
+        print(f"Wrote per-date results to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+# batch_scan.py
+"""Headless batch scanner: sweep a grid of scan configurations in parallel
+
+Example:
+    python batch_scan.py --thresholds 2 5 10 --sectors all Technology,Energy \\
+        --cap-ranges 10:200 0:500 --min-volumes 0 5 --out scans/ --format parquet
+"""
+
+import argparse
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from data_generator import N_STOCKS_HELP, universe_size
+from export import EXPORT_FORMATS, write_frame
+from shared_universe import SharedUniverse, attach
+
+# Set once per worker process by _init_worker
+_scanner = None
+
+
+def _init_worker(name, version):
+    """Memory-map the published universe and its indexes once per worker"""
+    global _scanner
+    _scanner = attach(name, version)
+
+
+def build_grid(thresholds, sector_sets, cap_ranges, min_volumes):
+    """Cartesian product of the scan parameters as a list of config dicts"""
+    return [
+        {
+            "threshold": threshold,
+            "sectors": sectors,
+            "min_cap": min_cap,
+            "max_cap": max_cap,
+            "min_volume": min_volume,
+        }
+        for threshold, sectors, (min_cap, max_cap), min_volume in itertools.product(
+            thresholds, sector_sets, cap_ranges, min_volumes
+        )
+    ]
+
+
+def run_config(config_id, config, out_dir, fmt):
+    """Run one scan in a worker and write its near-low rows"""
+    sectors = config["sectors"]
+    if sectors is None:
+        sectors = _scanner.sectors
+
+    start = time.perf_counter()
+    filtered_df, near_low_df = _scanner.scan(
+        sectors,
+        config["min_cap"],
+        config["max_cap"],
+        config["min_volume"],
+        config["threshold"],
+    )
+    elapsed = time.perf_counter() - start
+
+    path = Path(out_dir) / f"scan_{config_id:04d}.{fmt}"
+    write_frame(near_low_df, path, fmt)
+
+    return {
+        "config_id": config_id,
+        "threshold": config["threshold"],
+        "sectors": "all" if config["sectors"] is None else "|".join(sectors),
+        "min_cap": config["min_cap"],
+        "max_cap": config["max_cap"],
+        "min_volume": config["min_volume"],
+        "stocks_scanned": len(filtered_df),
+        "near_low": len(near_low_df),
+        "closest_to_low": (
+            float(near_low_df["% From Low"].min()) if len(near_low_df) else None
+        ),
+        "market_avg": (
+            float(filtered_df["% From Low"].mean()) if len(filtered_df) else None
+        ),
+        "scan_ms": round(elapsed * 1000, 3),
+        "output": path.name,
+    }
+
+
+def run_batch(grid, out_dir, fmt="csv", workers=None, n_stocks=None, seed=42):
+    """Run every config in ``grid`` over one shared universe and write a summary"""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    # Publish the universe if needed; workers then attach to the same version
+    shared = SharedUniverse.attach_or_publish(
+        n_stocks=n_stocks, seed=seed, compact=True
+    )
+
+    with ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(),
+        initializer=_init_worker,
+        initargs=(shared.name, shared.version),
+    ) as pool:
+        futures = [
+            pool.submit(run_config, i, config, out_dir, fmt)
+            for i, config in enumerate(grid)
+        ]
+        rows = [f.result() for f in futures]
+
+    summary = pd.DataFrame(rows)
+    write_frame(summary, out_dir / f"summary.{fmt}", fmt)
+    return summary
+
+
+def _cap_range(text):
+    low, high = text.split(":")
+    return float(low), float(high)
+
+
+def _sector_set(text):
+    return None if text.lower() == "all" else text.split(",")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[5.0])
+    parser.add_argument(
+        "--sectors",
+        type=_sector_set,
+        nargs="+",
+        default=[None],
+        help="Comma-separated sector sets, or 'all'",
+    )
+    parser.add_argument(
+        "--cap-ranges",
+        type=_cap_range,
+        nargs="+",
+        default=[(10.0, 200.0)],
+        help="Market cap ranges in billions as MIN:MAX",
+    )
+    parser.add_argument("--min-volumes", type=float, nargs="+", default=[5.0])
+    parser.add_argument(
+        "--grid",
+        type=Path,
+        help="JSON file with a list of config objects (overrides the sweep flags)",
+    )
+    parser.add_argument("--n-stocks", type=int, default=None, help=N_STOCKS_HELP)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--format", choices=list(EXPORT_FORMATS), default="csv")
+    parser.add_argument("--out", type=Path, default=Path("scan_results"))
+    args = parser.parse_args(argv)
+
+    if args.grid:
+        grid = json.loads(args.grid.read_text())
+    else:
+        grid = build_grid(
+            args.thresholds, args.sectors, args.cap_ranges, args.min_volumes
+        )
+
+    args.n_stocks = universe_size(args.n_stocks)
+    start = time.perf_counter()
+    summary = run_batch(
+        grid,
+        args.out,
+        fmt=args.format,
+        workers=args.workers,
+        n_stocks=args.n_stocks,
+        seed=args.seed,
+    )
+    elapsed = time.perf_counter() - start
+    print(
+        f"Ran {len(summary)} scans over {args.n_stocks:,} stocks in {elapsed:.2f}s "
+        f"-> {args.out}"
+    )
+
+
+if __name__ == "__main__":
+    main()
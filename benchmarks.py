@@ -0,0 +1,292 @@
+# benchmarks.py
+"""Benchmark suite for universe generation, scanning and chart building
+
+Example:
+    python benchmarks.py --sizes 500 50000 --out bench_results.json
+    python benchmarks.py --compare bench_results.json --out new.json
+"""
+
+import argparse
+import functools
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from data_generator import generate_stock_universe
+from incremental_scan import IncrementalScan
+from ranking import RANKINGS, Ranker
+from scanner import Scanner
+from screens import screen
+from sector_aggregates import SectorAggregates
+from visualizations import (
+    create_heatmap_chart,
+    create_scatter_chart,
+    create_sector_charts,
+)
+
+# The sidebar defaults in app.py
+DEFAULT_FILTERS = dict(min_cap=10.0, max_cap=200.0, min_volume=5.0, threshold=5.0)
+
+SCREEN_FILTERS = dict(
+    min_cap=DEFAULT_FILTERS["min_cap"],
+    max_cap=DEFAULT_FILTERS["max_cap"],
+    min_volume=DEFAULT_FILTERS["min_volume"],
+    low_threshold=DEFAULT_FILTERS["threshold"],
+)
+
+DEFAULT_SIZES = [500, 50_000, 1_000_000, 5_000_000]
+
+
+def mask_scan(df, sectors, min_cap, max_cap, min_volume, threshold):
+    """The boolean-mask scan app.py used before the Scanner"""
+    filtered_df = df[
+        (df["Sector"].isin(sectors))
+        & (df["Market Cap (B)"] >= min_cap)
+        & (df["Market Cap (B)"] <= max_cap)
+        & (df["Volume (M)"] >= min_volume)
+    ].copy()
+
+    filtered_df["Near Low"] = filtered_df["% From Low"] <= threshold
+    near_low_df = filtered_df[filtered_df["Near Low"]].sort_values("% From Low")
+    return filtered_df, near_low_df
+
+
+def best_of(fn, repeat=5):
+    """Fastest wall time of ``repeat`` calls, in seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def peak_memory(fn):
+    """Peak bytes allocated while running ``fn`` once, as seen by tracemalloc"""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def suite_cases(n):
+    """Yield ``(name, make)`` benchmark cases for a universe of ``n`` rows
+
+    ``make()`` does the case's setup and returns the function to time. Setup
+    shared by several cases is built on first use, so cases that are never
+    made, like those left out by ``--only``, cost nothing.
+    """
+
+    @functools.cache
+    def universe():
+        return generate_stock_universe(n_stocks=n)
+
+    @functools.cache
+    def sectors():
+        return sorted(universe()["Sector"].unique())
+
+    @functools.cache
+    def scanner():
+        return Scanner(universe())
+
+    @functools.cache
+    def scan():
+        filtered_df, _ = scanner().scan(sectors(), **DEFAULT_FILTERS)
+        return filtered_df, filtered_df.index.to_numpy()
+
+    @functools.cache
+    def sector_stats():
+        return (
+            SectorAggregates.from_scanner(scanner())
+            .update(scan()[1], DEFAULT_FILTERS["threshold"])
+            .frame()
+        )
+
+    def live_scan():
+        # A tick batch re-pricing 0.1% of the universe
+        changed = np.random.default_rng(0).choice(n, max(1, n // 1000), replace=False)
+        repriced = scanner().universe.copy()
+        repriced.loc[changed, "% From Low"] = np.round(
+            np.random.default_rng(1).uniform(0, 20, len(changed)), 1
+        )
+        incremental = IncrementalScan.from_scanner(
+            scanner(), repriced, sectors(), **DEFAULT_FILTERS
+        )
+        return lambda: incremental.update(repriced, changed)
+
+    def sector_update():
+        indexed, rows = scanner(), scan()[1]
+        return lambda: SectorAggregates.from_scanner(indexed).update(
+            rows, DEFAULT_FILTERS["threshold"]
+        )
+
+    def balanced_top():
+        df = universe()
+        ranker = Ranker.from_universe(df, RANKINGS["Balanced"])
+        return lambda: ranker.top(df, 20)
+
+    # A typical multiselect: two sectors on one exchange
+    def picked():
+        return sectors()[:2]
+
+    yield "generate_stock_universe", lambda: lambda: generate_stock_universe(n_stocks=n)
+    yield "mask_scan", lambda: functools.partial(
+        mask_scan, universe(), sectors(), **DEFAULT_FILTERS
+    )
+    yield "Scanner.__init__", lambda: functools.partial(Scanner, universe())
+    yield "Scanner.scan", lambda: functools.partial(
+        scanner().scan, sectors(), **DEFAULT_FILTERS
+    )
+
+    yield "isin (2 sectors)", lambda: functools.partial(
+        universe()["Sector"].isin, picked()
+    )
+    yield "bitmap (2 sectors)", lambda: functools.partial(
+        scanner().category_bitmap, picked()
+    )
+    yield "scan (2 sectors, NYSE)", lambda: functools.partial(
+        scanner().scan, picked(), **DEFAULT_FILTERS, exchanges=["NYSE"]
+    )
+
+    yield "screen (all screens)", lambda: functools.partial(
+        screen, scanner(), sectors(), **SCREEN_FILTERS
+    )
+
+    yield "nsmallest", lambda: functools.partial(universe().nsmallest, 20, "% From Low")
+    yield "Ranker.top", lambda: functools.partial(Ranker().top, universe(), 20)
+    yield "Ranker.top (balanced)", balanced_top
+
+    yield "IncrementalScan.update", live_scan
+    yield "SectorAggregates.update", sector_update
+
+    yield "create_heatmap_chart", lambda: functools.partial(
+        create_heatmap_chart, sector_stats()
+    )
+    yield "create_scatter_chart", lambda: functools.partial(
+        create_scatter_chart, scan()[0], DEFAULT_FILTERS["threshold"]
+    )
+    yield "create_sector_charts", lambda: functools.partial(
+        create_sector_charts, sector_stats()
+    )
+
+
+def run_suite(sizes, repeat=3, only=None, log=print):
+    """Time and measure peak memory of every case at every size"""
+    results = []
+    for n in sizes:
+        for name, make in suite_cases(n):
+            if only and name not in only:
+                continue
+            fn = make()
+            seconds = best_of(fn, repeat)
+            peak = peak_memory(fn)
+            results.append(
+                {"case": name, "rows": n, "seconds": seconds, "peak_bytes": peak}
+            )
+            log(
+                f"{name:<24} {n:>10,} rows  {seconds * 1e3:10.2f} ms  "
+                f"{peak / 1024**2:9.1f} MiB peak"
+            )
+    return results
+
+
+def environment():
+    """Metadata stored next to the results so runs can be compared"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+    }
+
+
+def compare(baseline, results):
+    """Ratio of new to baseline time and peak memory for matching cases"""
+    old = {(r["case"], r["rows"]): r for r in baseline["results"]}
+    rows = []
+    for r in results:
+        before = old.get((r["case"], r["rows"]))
+        if before is None:
+            continue
+        rows.append(
+            {
+                "case": r["case"],
+                "rows": r["rows"],
+                "time_ratio": r["seconds"] / before["seconds"],
+                "memory_ratio": r["peak_bytes"] / max(before["peak_bytes"], 1),
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def bench_scanner(sizes, repeat=5):
+    """Compare the mask scan with Scanner at each universe size"""
+    for n in sizes:
+        df = generate_stock_universe(n_stocks=n)
+        build = best_of(lambda: Scanner(df), 1)
+        scanner = Scanner(df)
+        sectors = scanner.sectors[:2]
+
+        def near_low_rows():
+            return scanner.filter_rows(
+                sectors,
+                DEFAULT_FILTERS["min_cap"],
+                DEFAULT_FILTERS["max_cap"],
+                DEFAULT_FILTERS["min_volume"],
+                max_from_low=1.0,
+            )
+
+        mask = best_of(lambda: mask_scan(df, sectors, **DEFAULT_FILTERS), repeat)
+        full = best_of(lambda: scanner.scan(sectors, **DEFAULT_FILTERS), repeat)
+        rows = best_of(near_low_rows, repeat)
+        print(
+            f"{n:>10,} rows | build {build * 1e3:8.1f} ms | mask scan "
+            f"{mask * 1e3:8.2f} ms | Scanner.scan {full * 1e3:8.2f} ms | "
+            f"near-low rows (<=1%) {rows * 1e3:8.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="+", help="Run only these case names")
+    parser.add_argument("--out", default="bench_results.json")
+    parser.add_argument("--compare", help="Earlier results file to compare against")
+    parser.add_argument(
+        "--scanner-only",
+        action="store_true",
+        help="Just print the mask scan vs Scanner comparison",
+    )
+    args = parser.parse_args()
+
+    if args.scanner_only:
+        bench_scanner(args.sizes, args.repeat)
+    else:
+        results = run_suite(args.sizes, args.repeat, args.only)
+        with open(args.out, "w") as f:
+            json.dump({"environment": environment(), "results": results}, f, indent=2)
+        print(f"Wrote {len(results)} results to {args.out}")
+
+        if args.compare:
+            with open(args.compare) as f:
+                print(compare(json.load(f), results).round(3).to_string(index=False))
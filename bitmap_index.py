@@ -0,0 +1,70 @@
+# bitmap_index.py
+import numpy as np
+import pandas as pd
+
+# Set bits in each byte value (numpy 1.26 has no bitwise_count)
+_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1)
+
+
+def popcount(bitmap):
+    """Number of rows set in a packed bitmap"""
+    return int(_POPCOUNT[bitmap].sum())
+
+
+def bitmap_rows(bitmap, n_rows):
+    """Row ids set in a packed bitmap, ascending"""
+    return np.flatnonzero(np.unpackbits(bitmap, count=n_rows))
+
+
+def bitmap_test(bitmap, rows):
+    """Whether each of ``rows`` is set in a packed bitmap"""
+    rows = np.asarray(rows)
+    return ((bitmap[rows >> 3] >> (7 - (rows & 7))) & 1).astype(bool)
+
+
+class BitmapIndex:
+    """One packed row bitmap per label of a categorical column
+
+    Built once per universe from integer codes, one bit per row. ``select``
+    turns a multiselect choice into the OR of the chosen labels' bitmaps,
+    so filtering compares no strings; bitmaps of different columns are
+    combined with AND and tested against candidate rows bit by bit.
+    """
+
+    def __init__(self, codes, labels):
+        self.codes = np.asarray(codes)
+        self.labels = list(labels)
+        self.n_rows = len(self.codes)
+        self._code_of = {label: code for code, label in enumerate(self.labels)}
+        self.bitmaps = np.empty(
+            (len(self.labels), (self.n_rows + 7) // 8), dtype=np.uint8
+        )
+        for code in range(len(self.labels)):
+            self.bitmaps[code] = np.packbits(self.codes == code)
+        self.counts = _POPCOUNT[self.bitmaps].sum(axis=1)
+        self.bitmaps.flags.writeable = False
+
+    @classmethod
+    def from_column(cls, column):
+        """Index a Series, with labels in sorted order
+
+        Codes are stored in the smallest signed integer type holding every
+        label (int8 for the app's columns) rather than factorize's int64.
+        """
+        codes, labels = pd.factorize(column, sort=True)
+        return cls(codes.astype(np.min_scalar_type(-max(len(labels), 1))), labels)
+
+    def select(self, labels):
+        """Bitmap of rows having any of ``labels``
+
+        Returns ``None`` when the choice does not restrict anything: no
+        choice given, or every label chosen. Unknown labels are ignored.
+        """
+        if labels is None:
+            return None
+        codes = sorted({self._code_of[l] for l in labels if l in self._code_of})
+        if len(codes) == len(self.labels):
+            return None
+        if not codes:
+            return np.zeros(self.bitmaps.shape[1], dtype=np.uint8)
+        return np.bitwise_or.reduce(self.bitmaps[codes], axis=0)
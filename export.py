@@ -0,0 +1,82 @@
+# export.py
+import io
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+EXPORT_FORMATS = {
+    "csv": ("CSV", "text/csv"),
+    "parquet": ("Parquet", "application/vnd.apache.parquet"),
+    "arrow": ("Arrow IPC", "application/vnd.apache.arrow.file"),
+}
+
+CHUNK_ROWS = 50_000
+
+
+def iter_csv_chunks(df, chunk_rows=CHUNK_ROWS):
+    """Yield the frame as UTF-8 CSV bytes, ``chunk_rows`` rows at a time"""
+    yield df.iloc[:0].to_csv(index=False).encode()
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start : start + chunk_rows]
+        yield chunk.to_csv(index=False, header=False).encode()
+
+
+def _record_batches(df, chunk_rows):
+    """Arrow schema and a generator of record batches for the frame"""
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+
+    def batches():
+        for start in range(0, len(df), chunk_rows):
+            chunk = df.iloc[start : start + chunk_rows]
+            yield pa.RecordBatch.from_pandas(chunk, schema=schema, preserve_index=False)
+
+    return schema, batches()
+
+
+def write_frame(df, sink, fmt="csv", chunk_rows=CHUNK_ROWS):
+    """Write the frame to a path or binary file object without building it whole
+
+    CSV is written chunk by chunk, Parquet one row group per chunk and Arrow
+    IPC one record batch per chunk, so peak memory follows ``chunk_rows``
+    rather than the size of the result.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format {fmt!r}")
+
+    if fmt == "csv":
+        if hasattr(sink, "write"):
+            for chunk in iter_csv_chunks(df, chunk_rows):
+                sink.write(chunk)
+        else:
+            with open(sink, "wb") as f:
+                for chunk in iter_csv_chunks(df, chunk_rows):
+                    f.write(chunk)
+        return sink
+
+    schema, batches = _record_batches(df, chunk_rows)
+    if fmt == "parquet":
+        with pq.ParquetWriter(sink, schema) as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+    else:
+        with pa.ipc.new_file(sink, schema) as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+    return sink
+
+
+def export_buffer(df, fmt="csv", chunk_rows=CHUNK_ROWS):
+    """The frame encoded in ``fmt`` as a rewound in-memory file"""
+    buffer = io.BytesIO()
+    write_frame(df, buffer, fmt, chunk_rows)
+    buffer.seek(0)
+    return buffer
+
+
+def export_bytes(df, fmt="csv", chunk_rows=CHUNK_ROWS):
+    """The frame encoded in ``fmt``, for download buttons and HTTP responses
+
+    Returns a memoryview of the encoded buffer rather than a copy of it, so
+    the export is held in memory once.
+    """
+    return export_buffer(df, fmt, chunk_rows).getbuffer()
@@ -0,0 +1,158 @@
+# incremental_scan.py
+import numpy as np
+
+from bitmap_index import bitmap_test
+from scan_cache import scan_key
+
+
+class IncrementalScan:
+    """A near-low scan that is patched, not rerun, when some rows change
+
+    For one set of filters the scan keeps a per-row "passes the category/
+    cap/volume filters" flag and the near-low rows as parallel arrays sorted by
+    (% From Low, row id), the order ``Scanner.scan`` returns. ``update``
+    re-evaluates only the changed rows: those that were near-low are deleted
+    at their binary-searched position, and those that qualify now are
+    inserted at theirs, so a row whose value moved is a delete plus an
+    insert. Nothing else in the universe is looked at.
+    """
+
+    def __init__(
+        self,
+        universe,
+        category_bitmap,
+        sectors,
+        min_cap,
+        max_cap,
+        min_volume,
+        threshold,
+        version=None,
+        industries=None,
+        exchanges=None,
+    ):
+        # The same tuple as the scan's cache key, without the version
+        self.filters = scan_key(
+            None,
+            sectors,
+            min_cap,
+            max_cap,
+            min_volume,
+            threshold,
+            industries,
+            exchanges,
+        )[1:]
+        self.version = version
+        # Rows matching the category choices; None when they restrict nothing
+        self.category_bitmap = category_bitmap
+        self.inserted = 0
+        self.deleted = 0
+
+        rows = np.arange(len(universe))
+        self.member = self._passes(universe, rows)
+        # % From Low as of each row's last evaluation; locates it when it leaves.
+        # Kept in the column's dtype so float32 rows compare like Scanner.scan's
+        self.from_low = universe["% From Low"].to_numpy().copy()
+        near = rows[self.member & (self.from_low <= self.threshold)]
+        self._rows = near[np.lexsort((near, self.from_low[near]))]
+        self._keys = self.from_low[self._rows]
+
+    @classmethod
+    def from_scanner(
+        cls,
+        scanner,
+        universe,
+        sectors,
+        min_cap,
+        max_cap,
+        min_volume,
+        threshold,
+        version=None,
+        industries=None,
+        exchanges=None,
+    ):
+        """Scan ``universe``, a re-priced copy of the scanner's, with its bitmaps"""
+        return cls(
+            universe,
+            scanner.category_bitmap(sectors, industries, exchanges),
+            sectors,
+            min_cap,
+            max_cap,
+            min_volume,
+            threshold,
+            version,
+            industries,
+            exchanges,
+        )
+
+    @property
+    def threshold(self):
+        return self.from_low.dtype.type(self.filters[4])
+
+    def _passes(self, universe, rows):
+        _, min_cap, max_cap, min_volume = self.filters[:4]
+        cap = universe["Market Cap (B)"].to_numpy()[rows]
+        volume = universe["Volume (M)"].to_numpy()[rows]
+        passes = (cap >= min_cap) & (cap <= max_cap) & (volume >= min_volume)
+        if self.category_bitmap is not None:
+            passes &= bitmap_test(self.category_bitmap, rows)
+        return passes
+
+    def _locate(self, keys, rows):
+        """Positions of ``(key, row)`` pairs in the sorted arrays"""
+        left = np.searchsorted(self._keys, keys, "left")
+        right = np.searchsorted(self._keys, keys, "right")
+        # Equal keys are ordered by row id
+        for i in np.flatnonzero(right > left).tolist():
+            left[i] += np.searchsorted(self._rows[left[i] : right[i]], rows[i])
+        return left
+
+    def update(self, universe, rows, version=None):
+        """Re-evaluate ``rows`` against ``universe`` and patch the near-low order
+
+        Returns the number of rows deleted from and inserted into the
+        near-low set (a moved row counts once in each).
+        """
+        rows = np.unique(np.asarray(rows, dtype=np.int64))
+        if version is not None:
+            self.version = version
+        if not len(rows):
+            return 0, 0
+
+        was_near = rows[self.member[rows] & (self.from_low[rows] <= self.threshold)]
+        if len(was_near):
+            positions = self._locate(self.from_low[was_near], was_near)
+            self._rows = np.delete(self._rows, positions)
+            self._keys = np.delete(self._keys, positions)
+
+        self.member[rows] = self._passes(universe, rows)
+        self.from_low[rows] = universe["% From Low"].to_numpy()[rows]
+        now_near = rows[self.member[rows] & (self.from_low[rows] <= self.threshold)]
+        if len(now_near):
+            keys = self.from_low[now_near]
+            order = np.lexsort((now_near, keys))
+            now_near, keys = now_near[order], keys[order]
+            positions = self._locate(keys, now_near)
+            self._rows = np.insert(self._rows, positions, now_near)
+            self._keys = np.insert(self._keys, positions, keys)
+
+        self.deleted += len(was_near)
+        self.inserted += len(now_near)
+        return len(was_near), len(now_near)
+
+    @property
+    def near_low_rows(self):
+        """Near-low row ids sorted by % From Low, ties by row id"""
+        return self._rows
+
+    def filtered_rows(self):
+        """Row ids passing the category/cap/volume filters, in universe order"""
+        return np.flatnonzero(self.member)
+
+    def results(self, universe):
+        """``(filtered_df, near_low_df)`` shaped like ``Scanner.scan``'s"""
+        filtered_rows = self.filtered_rows()
+        filtered_df = universe.take(filtered_rows)
+        filtered_df["Near Low"] = self.from_low[filtered_rows] <= self.threshold
+        near_low_df = universe.take(self._rows)
+        near_low_df["Near Low"] = True
+        return filtered_df, near_low_df
@@ -0,0 +1,402 @@
+# market_feed.py
+"""Asyncio quote feed: a local replay server and a client batching ticks into the universe
+
+Example:
+    python market_feed.py --rate 20000 --seconds 5 --flush-interval 0.25
+"""
+
+import argparse
+import asyncio
+import itertools
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from tick_updater import WeekLowHighTracker
+
+# Wire format: one ASCII quote per line, "SYMBOL PRICE TIMESTAMP_NS\n"
+READ_BYTES = 64 * 1024
+
+FLUSH_INTERVAL = 0.25
+
+_feed_ids = itertools.count(1)
+
+
+def generate_ticks(universe, n_ticks=100_000, seed=7, volatility=0.002):
+    """Random-walk quotes around the universe's current prices
+
+    Returns a ``Symbol``/``Price`` frame in replay order; each symbol's
+    prices follow their own walk starting from its current price.
+    """
+    rng = np.random.default_rng(seed)
+    symbols = universe["Symbol"].to_numpy(dtype=object)
+    base = universe["Current Price"].to_numpy(np.float64)
+    rows = rng.integers(0, len(universe), n_ticks)
+    steps = rng.normal(0.0, volatility, n_ticks)
+
+    # Cumulative sum of the steps within each symbol, in tick order
+    order = np.argsort(rows, kind="stable")
+    sorted_rows = rows[order]
+    walk = np.cumsum(steps[order])
+    starts = np.flatnonzero(np.r_[True, sorted_rows[1:] != sorted_rows[:-1]])
+    offsets = walk[starts] - steps[order][starts]
+    walk -= np.repeat(offsets, np.diff(np.r_[starts, n_ticks]))
+    log_path = np.empty(n_ticks)
+    log_path[order] = walk
+
+    return pd.DataFrame(
+        {"Symbol": symbols[rows], "Price": np.round(base[rows] * np.exp(log_path), 4)}
+    )
+
+
+def _encode(ticks):
+    """Each tick as ``b"SYMBOL PRICE "``, ready for a timestamp and newline"""
+    return [
+        f"{symbol} {price:.4f} ".encode()
+        for symbol, price in zip(ticks["Symbol"].tolist(), ticks["Price"].tolist())
+    ]
+
+
+class ReplayServer:
+    """TCP stand-in for a market data feed, replaying ticks at a fixed rate
+
+    Every connection gets the ticks from the start, sent in bursts every
+    ``interval`` seconds and stamped with the send time. ``drain_seconds``
+    adds up how long the server waited on slow readers.
+    """
+
+    def __init__(
+        self, ticks, rate=5000, interval=0.01, host="127.0.0.1", port=0, loop=True
+    ):
+        self.lines = _encode(ticks)
+        self.rate = rate
+        self.interval = interval
+        self.host = host
+        self.port = port
+        self.loop = loop
+        self.sent = 0
+        self.drain_seconds = 0.0
+        self._server = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _serve(self, reader, writer):
+        burst = max(1, round(self.rate * self.interval))
+        position = 0
+        deadline = time.perf_counter()
+        try:
+            while position < len(self.lines) or self.loop:
+                if position >= len(self.lines):
+                    position = 0
+                chunk = self.lines[position : position + burst]
+                position += len(chunk)
+
+                stamp = b"%d\n" % time.time_ns()
+                writer.write(b"".join(line + stamp for line in chunk))
+                start = time.perf_counter()
+                await writer.drain()
+                self.drain_seconds += time.perf_counter() - start
+                self.sent += len(chunk)
+
+                deadline += self.interval
+                await asyncio.sleep(max(0.0, deadline - time.perf_counter()))
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+
+class FeedMetrics:
+    """Throughput and backpressure counters for a FeedClient"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.received = 0
+        self.unknown = 0
+        self.flushes = 0
+        self.rows_written = 0
+        self.queue_depth = 0
+        self.queue_high_water = 0
+        self.blocked_seconds = 0.0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self.lag_ms = 0.0
+
+    def as_dict(self):
+        elapsed = time.perf_counter() - self.started
+        return {
+            "ticks_received": self.received,
+            "ticks_per_sec": round(self.received / elapsed, 1) if elapsed else 0.0,
+            "unknown_symbols": self.unknown,
+            "flushes": self.flushes,
+            "rows_written": self.rows_written,
+            "coalesce_ratio": (
+                round(self.received / self.rows_written, 2)
+                if self.rows_written
+                else 0.0
+            ),
+            "queue_depth": self.queue_depth,
+            "queue_high_water": self.queue_high_water,
+            "reader_blocked_s": round(self.blocked_seconds, 3),
+            "last_flush_ms": round(self.last_flush_ms, 3),
+            "max_flush_ms": round(self.max_flush_ms, 3),
+            "lag_ms": round(self.lag_ms, 1),
+        }
+
+
+class FeedClient:
+    """Read quotes from a feed and write them into the universe in batches
+
+    A reader task parses whatever bytes have arrived into arrays and puts
+    them on a bounded queue; when the queue is full the reader waits, which
+    stops it reading the socket and pushes back on the server. A flush task
+    wakes every ``flush_interval`` seconds, coalesces the queued ticks to
+    one low/high/last per symbol, applies them to the tracker and publishes
+    a new universe frame. ``published`` is a ``(version, frame)`` pair that
+    other threads can read at any time; ``row_version`` records which
+    version last touched each row.
+    """
+
+    def __init__(self, tracker, flush_interval=FLUSH_INTERVAL, max_queue=256):
+        self.tracker = tracker
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self.metrics = FeedMetrics()
+        self.published = (0, tracker.to_frame())
+        # Feed version that last changed each row, for delta re-scans
+        self.row_version = np.zeros(len(tracker.universe), dtype=np.int64)
+        self._queue = None
+
+    def _parse(self, text):
+        fields = text.split()
+        rows = np.fromiter(
+            (self.tracker.row_of(s) for s in fields[0::3]),
+            dtype=np.int64,
+            count=len(fields) // 3,
+        )
+        prices = np.array(fields[1::3], dtype=np.float64)
+        stamps = np.array(fields[2::3], dtype=np.int64)
+        known = rows >= 0
+        self.metrics.received += len(rows)
+        self.metrics.unknown += len(rows) - int(known.sum())
+        return rows[known], prices[known], stamps[known]
+
+    async def _read(self, reader):
+        pending = b""
+        while True:
+            data = await reader.read(READ_BYTES)
+            if not data:
+                break
+            pending += data
+            cut = pending.rfind(b"\n") + 1
+            if not cut:
+                continue
+            batch = self._parse(pending[:cut].decode())
+            pending = pending[cut:]
+
+            start = time.perf_counter()
+            await self._queue.put(batch)
+            self.metrics.blocked_seconds += time.perf_counter() - start
+            depth = self._queue.qsize()
+            self.metrics.queue_depth = depth
+            self.metrics.queue_high_water = max(self.metrics.queue_high_water, depth)
+
+    def flush(self):
+        """Apply everything queued so far and publish a new frame"""
+        batches = []
+        while not self._queue.empty():
+            batches.append(self._queue.get_nowait())
+        self.metrics.queue_depth = 0
+        if not batches:
+            return False
+
+        start = time.perf_counter()
+        rows, prices, stamps = (np.concatenate(parts) for parts in zip(*batches))
+        touched, slot = np.unique(rows, return_inverse=True)
+        lows = np.full(len(touched), np.inf)
+        highs = np.full(len(touched), -np.inf)
+        latest = np.zeros(len(touched), dtype=np.int64)
+        np.minimum.at(lows, slot, prices)
+        np.maximum.at(highs, slot, prices)
+        np.maximum.at(latest, slot, stamps)
+        lasts = np.empty(len(touched))
+        # Fancy assignment keeps the last write for repeated rows
+        lasts[slot] = prices
+
+        self.tracker.update_extremes(touched, lows, highs, lasts, latest, len(rows))
+        version = self.published[0] + 1
+        self.row_version[touched] = version
+        # Only the touched rows of the price columns are rewritten
+        frame = self.tracker.to_frame(touched, previous=self.published[1])
+        self.published = (version, frame)
+
+        elapsed = (time.perf_counter() - start) * 1e3
+        self.metrics.flushes += 1
+        self.metrics.rows_written += len(touched)
+        self.metrics.last_flush_ms = elapsed
+        self.metrics.max_flush_ms = max(self.metrics.max_flush_ms, elapsed)
+        if len(stamps):
+            self.metrics.lag_ms = (time.time_ns() - int(stamps.max())) / 1e6
+        return True
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            self.flush()
+
+    async def run(self, host, port):
+        """Consume the feed at ``host:port`` until it closes or the task is cancelled"""
+        self._queue = asyncio.Queue(self.max_queue)
+        reader, writer = await asyncio.open_connection(host, port)
+        flusher = asyncio.create_task(self._flush_loop())
+        try:
+            await self._read(reader)
+        finally:
+            flusher.cancel()
+            writer.close()
+            self.flush()
+
+
+class LiveFeed:
+    """A replay server and feed client running on their own event loop thread
+
+    Streamlit reruns only read ``snapshot()`` and ``metrics()``, so the
+    script thread never waits on the network or on tick processing. ``id``
+    is unique per feed, so readers can tell a restarted feed from this one.
+    """
+
+    def __init__(self, universe, ticks=None, rate=5000, flush_interval=FLUSH_INTERVAL):
+        self.id = next(_feed_ids)
+        self.server = ReplayServer(
+            generate_ticks(universe) if ticks is None else ticks, rate=rate
+        )
+        self.client = FeedClient(
+            WeekLowHighTracker(universe), flush_interval=flush_interval
+        )
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="market-feed", daemon=True
+        )
+        self._task = None
+
+    async def _run(self):
+        await self.server.start()
+        await self.client.run(self.server.host, self.server.port)
+
+    @classmethod
+    def start(cls, universe, **kwargs):
+        feed = cls(universe, **kwargs)
+        feed._thread.start()
+        feed._task = asyncio.run_coroutine_threadsafe(feed._run(), feed._loop)
+        return feed
+
+    def snapshot(self):
+        """``(version, universe frame)`` as of the last flush"""
+        return self.client.published
+
+    def changed_since(self, version):
+        """Rows updated by any flush after ``version``"""
+        return np.flatnonzero(self.client.row_version > version)
+
+    def metrics(self):
+        return {**self.client.metrics.as_dict(), "server_sent": self.server.sent}
+
+    @property
+    def running(self):
+        return self._thread.is_alive()
+
+    async def _shutdown(self):
+        await self.server.close()
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stop(self, timeout=5):
+        """Close the server, cancel the client and end the event loop thread"""
+        if not self.running:
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        self._loop.close()
+
+
+class SharedFeed:
+    """One LiveFeed for many subscribers, running only while any is subscribed
+
+    The first ``subscribe`` starts the feed and the last ``unsubscribe``
+    stops it, so a feed nobody watches does not keep its server and thread
+    alive. Subscribing again after that starts a fresh feed.
+    """
+
+    def __init__(self, universe_factory, **kwargs):
+        self._universe_factory = universe_factory
+        self._kwargs = kwargs
+        self._lock = threading.Lock()
+        self._subscribers = set()
+        self.feed = None
+
+    def subscribe(self, key):
+        """Register ``key`` and return the running feed, starting it if needed"""
+        with self._lock:
+            self._subscribers.add(key)
+            if self.feed is None:
+                self.feed = LiveFeed.start(self._universe_factory(), **self._kwargs)
+            return self.feed
+
+    def unsubscribe(self, key):
+        """Drop ``key``; stops the feed when it was the last subscriber"""
+        with self._lock:
+            self._subscribers.discard(key)
+            if self._subscribers or self.feed is None:
+                return
+            feed, self.feed = self.feed, None
+        feed.stop()
+
+
+async def _replay(universe, rate, seconds, flush_interval):
+    server = await ReplayServer(generate_ticks(universe), rate=rate).start()
+    client = FeedClient(WeekLowHighTracker(universe), flush_interval=flush_interval)
+    task = asyncio.create_task(client.run(server.host, server.port))
+    await asyncio.sleep(seconds)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    await server.close()
+    return client, server
+
+
+def main(argv=None):
+    from data_generator import N_STOCKS_HELP
+    from snapshot import load_universe
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n-stocks", type=int, default=None, help=N_STOCKS_HELP)
+    parser.add_argument("--rate", type=int, default=5000, help="Ticks per second")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--flush-interval", type=float, default=FLUSH_INTERVAL)
+    args = parser.parse_args(argv)
+
+    universe = load_universe(n_stocks=args.n_stocks, compact=True)
+    client, server = asyncio.run(
+        _replay(universe, args.rate, args.seconds, args.flush_interval)
+    )
+    print(f"Server sent {server.sent:,} ticks, waited {server.drain_seconds:.3f}s")
+    for name, value in client.metrics.as_dict().items():
+        print(f"{name:<18} {value}")
+    frame = client.published[1]
+    print(frame.nsmallest(5, "% From Low")[["Symbol", "Current Price", "% From Low"]])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# price_history.py
+import numpy as np
+import pandas as pd
+
+from data_generator import generate_stock_universe
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+def trading_days(n_days, end=None):
+    """Business-day calendar of ``n_days`` sessions ending at ``end``"""
+    end = pd.Timestamp.today().normalize() if end is None else pd.Timestamp(end)
+    return pd.bdate_range(end=end, periods=n_days)
+
+
+def generate_price_history(end_prices, n_days=2 * TRADING_DAYS_PER_YEAR, seed=42):
+    """Generate a (n_days, n_symbols) panel of daily closes
+
+    Each column is a geometric random walk with its own volatility, scaled so
+    the last close equals the matching entry of ``end_prices``.
+    """
+    end_prices = np.asarray(end_prices, dtype=np.float64)
+    rng = np.random.default_rng(seed)
+
+    daily_vol = rng.uniform(0.008, 0.035, end_prices.size)
+    drift = rng.normal(0.0, 0.0005, end_prices.size)
+    log_returns = rng.standard_normal((n_days, end_prices.size))
+    log_returns *= daily_vol
+    log_returns += drift
+
+    log_path = np.cumsum(log_returns, axis=0)
+    log_path -= log_path[-1]
+    return np.exp(log_path, out=log_path) * end_prices
+
+
+def _rolling_extreme(values, window, ufunc):
+    """Trailing-window reduction along axis 0 with the van Herk/Gil-Werman scheme
+
+    The series is cut into blocks of ``window`` rows; a prefix scan inside
+    each block and a suffix scan inside each block give the extreme of any
+    window as ``ufunc(suffix[t - window + 1], prefix[t])``, so the cost is
+    three passes regardless of the window length. The first ``window - 1``
+    rows use an expanding window.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = values.shape[0]
+    if window <= 1 or n == 0:
+        return values.copy()
+    window = min(window, n)
+
+    n_blocks = -(-n // window)
+    pad = n_blocks * window - n
+    if pad:
+        fill = np.full((pad,) + values.shape[1:], values[-1])
+        padded = np.concatenate([values, fill], axis=0)
+    else:
+        padded = values
+    blocks = padded.reshape((n_blocks, window) + values.shape[1:])
+
+    prefix = ufunc.accumulate(blocks, axis=1).reshape(padded.shape)[:n]
+    suffix = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].reshape(padded.shape)
+
+    out = np.empty_like(values)
+    out[: window - 1] = ufunc.accumulate(values[: window - 1], axis=0)
+    ufunc(suffix[: n - window + 1], prefix[window - 1 :], out=out[window - 1 :])
+    return out
+
+
+def rolling_min(values, window=TRADING_DAYS_PER_YEAR):
+    """Trailing rolling minimum along axis 0"""
+    return _rolling_extreme(values, window, np.minimum)
+
+
+def rolling_max(values, window=TRADING_DAYS_PER_YEAR):
+    """Trailing rolling maximum along axis 0"""
+    return _rolling_extreme(values, window, np.maximum)
+
+
+def week_52_stats(closes, window=TRADING_DAYS_PER_YEAR):
+    """52-week low/high and distance from them for every day of a closes panel"""
+    closes = np.asarray(closes, dtype=np.float64)
+    low = rolling_min(closes, window)
+    high = rolling_max(closes, window)
+    return {
+        "52W Low": low,
+        "52W High": high,
+        "% From Low": (closes - low) / low * 100,
+        "% From High": (closes - high) / high * 100,
+    }
+
+
+def apply_history(universe, closes, window=TRADING_DAYS_PER_YEAR):
+    """Replace the universe's 52-week columns with values computed from history"""
+    last = closes[-1]
+    low = closes[-window:].min(axis=0)
+    high = closes[-window:].max(axis=0)
+
+    out = universe.copy()
+    out["Current Price"] = np.round(last, 2)
+    out["52W Low"] = np.round(low, 2)
+    out["52W High"] = np.round(high, 2)
+    out["% From Low"] = np.round((last - low) / low * 100, 1)
+    out["% From High"] = np.round((last - high) / high * 100, 1)
+    return out
+
+
+def generate_universe_with_history(
+    n_stocks=None, n_days=2 * TRADING_DAYS_PER_YEAR, seed=42
+):
+    """Universe whose 52-week columns come from a generated daily history
+
+    Returns ``(universe, dates, closes)``; ``closes`` has one column per
+    universe row, in the same order.
+    """
+    universe = generate_stock_universe(n_stocks=n_stocks, seed=seed)
+    closes = generate_price_history(
+        universe["Current Price"].to_numpy(), n_days=n_days, seed=seed
+    )
+    return apply_history(universe, closes), trading_days(n_days), closes
+
+
+# Quick test if run directly
+if __name__ == "__main__":
+    import time
+
+    start = time.perf_counter()
+    universe, dates, closes = generate_universe_with_history(n_stocks=5000, n_days=756)
+    stats = week_52_stats(closes)
+    elapsed = time.perf_counter() - start
+    print(f"{closes.shape[1]} symbols x {closes.shape[0]} days in {elapsed:.2f}s")
+    print(
+        universe[
+            ["Symbol", "Current Price", "52W Low", "52W High", "% From Low"]
+        ].head()
+    )
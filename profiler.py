@@ -0,0 +1,97 @@
+# profiler.py
+import json
+import logging
+import time
+import uuid
+from contextlib import nullcontext
+
+import pandas as pd
+
+# One JSON object per line on stderr, ready for a log shipper
+logger = logging.getLogger("scanner.perf")
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+# Handed out by disabled profilers so a span costs one attribute check
+_NULL_SPAN = nullcontext()
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        self.profiler.spans.append((self.name, self.start, elapsed))
+        return False
+
+
+class Profiler:
+    """Named timing spans for one app run
+
+    Use ``with profiler.span("filter"): ...`` around each phase. A disabled
+    profiler returns a shared no-op context manager and records nothing.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.run_id = uuid.uuid4().hex[:12]
+        self.spans = []
+        self._origin = time.perf_counter()
+
+    def span(self, name):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    @property
+    def total(self):
+        return time.perf_counter() - self._origin
+
+    def frame(self):
+        """Spans as a DataFrame in run order, with share of total run time"""
+        total = self.total
+        return pd.DataFrame(
+            [
+                {
+                    "Phase": name,
+                    "Start (ms)": (start - self._origin) * 1e3,
+                    "Time (ms)": elapsed * 1e3,
+                    "% of run": elapsed / total * 100 if total else 0.0,
+                }
+                for name, start, elapsed in self.spans
+            ],
+            columns=["Phase", "Start (ms)", "Time (ms)", "% of run"],
+        )
+
+    def to_json(self, **extra):
+        """One structured record for the whole run"""
+        return json.dumps(
+            {
+                "event": "scanner_run",
+                "run_id": self.run_id,
+                "total_ms": round(self.total * 1e3, 3),
+                "spans": [
+                    {"name": name, "ms": round(elapsed * 1e3, 3)}
+                    for name, _, elapsed in self.spans
+                ],
+                **extra,
+            },
+            default=str,
+        )
+
+    def emit(self, **extra):
+        """Log the run record as JSON on the ``scanner.perf`` logger"""
+        if self.enabled:
+            logger.info(self.to_json(**extra))
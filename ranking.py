@@ -0,0 +1,75 @@
+# ranking.py
+import numpy as np
+
+# Lower scores rank first; negative weights reward larger values
+RANKINGS = {
+    "Closest to low": {"% From Low": 1.0},
+    "Near low, most liquid": {"% From Low": 1.0, "Volume (M)": -0.5},
+    "Near low, largest cap": {"% From Low": 1.0, "Market Cap (B)": -0.5},
+    "Balanced": {"% From Low": 1.0, "Volume (M)": -0.25, "Market Cap (B)": -0.25},
+}
+
+
+def top_k(values, k):
+    """Positions of the ``k`` smallest values, ascending, ties in position order
+
+    ``np.argpartition`` finds the k-th smallest value in linear time; only
+    the rows at or below it are sorted, so the result equals
+    ``np.argsort(values, kind="stable")[:k]`` without the full sort.
+    """
+    values = np.asarray(values)
+    n = len(values)
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp)
+    if k >= n:
+        return np.argsort(values, kind="stable")
+
+    kth = values[np.argpartition(values, k - 1)[k - 1]]
+    below = np.flatnonzero(values < kth)
+    # Rows tied with the k-th value are taken in position order
+    tied = np.flatnonzero(values == kth)[: k - len(below)]
+    rows = np.concatenate([below, tied])
+    return rows[np.lexsort((rows, values[rows]))]
+
+
+class Ranker:
+    """Top-K rows by a weighted composite score
+
+    The score is ``sum(weight * column / scale)`` over the weighted columns,
+    accumulated into one buffer column by column; lower ranks first.
+    Scales default to each column's standard deviation, so the weights
+    compare columns in comparable units.
+    """
+
+    def __init__(self, weights=None, scales=None):
+        self.weights = dict(RANKINGS["Closest to low"] if weights is None else weights)
+        self.scales = {column: 1.0 for column in self.weights}
+        self.scales.update(scales or {})
+
+    @classmethod
+    def from_universe(cls, universe, weights=None):
+        """Ranker whose scales are the universe's column standard deviations"""
+        weights = RANKINGS["Closest to low"] if weights is None else weights
+        scales = {}
+        for column in weights:
+            std = float(np.std(universe[column].to_numpy(np.float64)))
+            scales[column] = std if std > 0 else 1.0
+        return cls(weights, scales)
+
+    def score(self, frame):
+        """Composite score of every row of ``frame``"""
+        if list(self.weights) == ["% From Low"] and self.weights["% From Low"] > 0:
+            # A single positive weight ranks like the raw column
+            return frame["% From Low"].to_numpy()
+        score = np.zeros(len(frame))
+        for column, weight in self.weights.items():
+            score += frame[column].to_numpy() * (weight / self.scales[column])
+        return score
+
+    def top_rows(self, frame, k):
+        """Positions in ``frame`` of its ``k`` best-scored rows, best first"""
+        return top_k(self.score(frame), k)
+
+    def top(self, frame, k):
+        """The ``k`` best-scored rows of ``frame``, best first"""
+        return frame.take(self.top_rows(frame, k))
@@ -0,0 +1,109 @@
+# scan_cache.py
+import threading
+from collections import OrderedDict
+
+
+def scan_key(
+    version,
+    sectors,
+    min_cap,
+    max_cap,
+    min_volume,
+    threshold,
+    industries=None,
+    exchanges=None,
+):
+    """Canonical cache key for a scan: label order and number types don't matter
+
+    ``None`` industries or exchanges (no restriction) stay ``None``.
+    """
+    return (
+        version,
+        tuple(sorted(sectors)),
+        float(min_cap),
+        float(max_cap),
+        float(min_volume),
+        float(threshold),
+        None if industries is None else tuple(sorted(industries)),
+        None if exchanges is None else tuple(sorted(exchanges)),
+    )
+
+
+def _nbytes(value):
+    """Approximate memory held by a cached result (a tuple of DataFrames)"""
+    return sum(int(df.memory_usage(index=True, deep=True).sum()) for df in value)
+
+
+class ScanCache:
+    """Bounded LRU cache of ``(filtered_df, near_low_df)`` scan results
+
+    Entries are evicted least-recently-used first whenever either the entry
+    count or the total memory cap is exceeded. Results larger than the memory
+    cap on their own are returned but not stored. Cached frames are shared
+    between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries=64, max_bytes=256 * 1024**2):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Cached result for ``key``, or None; counts a hit or a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        """Store a result, evicting old entries to stay under both caps"""
+        size = _nbytes(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[1]
+            self._entries[key] = (value, size)
+            self.nbytes += size
+            while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+                self.evictions += 1
+
+    def get_or_compute(self, key, compute):
+        """Return the cached result for ``key``, computing and storing it on a miss"""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self):
+        """Counters for display or logging"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.nbytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
@@ -0,0 +1,244 @@
+# scanner.py
+import itertools
+
+import numpy as np
+
+from bitmap_index import BitmapIndex, bitmap_rows, bitmap_test, popcount
+
+# Columns that get a sorted-order index
+INDEXED_COLUMNS = ("% From Low", "Market Cap (B)", "Volume (M)")
+
+# Columns that get a bitmap index, when the universe has them
+CATEGORY_COLUMNS = ("Sector", "Industry", "Exchange")
+
+_versions = itertools.count(1)
+
+
+class Scanner:
+    """Answer near-low scans from sorted-order indexes built once per universe
+
+    For every indexed column the scanner keeps the row order that sorts it and
+    the sorted values. A threshold or range predicate is then two binary
+    searches returning a slice of row ids; scans start from the smallest
+    slice and check the remaining predicates only on those rows. Sector,
+    industry and exchange choices are answered from per-label bitmaps.
+
+    ``version`` identifies the universe for result caches; when omitted each
+    Scanner gets a fresh process-unique number. A Scanner may be shared by
+    many sessions and threads, so its index arrays are read-only.
+    """
+
+    def __init__(self, universe, version=None):
+        self.universe = universe.reset_index(drop=True)
+        self.version = next(_versions) if version is None else version
+        self._values = {}
+        self._order = {}
+        self._sorted = {}
+        for column in INDEXED_COLUMNS:
+            values = self.universe[column].to_numpy()
+            order = np.argsort(values, kind="stable")
+            self._values[column] = values
+            self._order[column] = order
+            self._sorted[column] = values[order]
+
+        self._categories = {
+            column: BitmapIndex.from_column(self.universe[column])
+            for column in CATEGORY_COLUMNS
+            if column in self.universe
+        }
+        self._freeze()
+
+    def _freeze(self):
+        for array in (
+            *(index.codes for index in self._categories.values()),
+            *self._values.values(),
+            *self._order.values(),
+            *self._sorted.values(),
+        ):
+            array.flags.writeable = False
+
+    def index_arrays(self):
+        """The indexes as named flat arrays, for storing next to the universe"""
+        arrays = {f"codes/{c}": index.codes for c, index in self._categories.items()}
+        for column in INDEXED_COLUMNS:
+            arrays[f"order/{column}"] = self._order[column]
+            arrays[f"sorted/{column}"] = self._sorted[column]
+        return arrays
+
+    @classmethod
+    def from_index(cls, universe, arrays, category_labels, version=None):
+        """A Scanner over ``universe`` reusing arrays from ``index_arrays``
+
+        ``category_labels`` is ``category_labels()`` of the indexed Scanner.
+        Nothing is sorted or copied, so a universe and index memory-mapped
+        from disk are used in place; only the category bitmaps are rebuilt
+        from the stored codes. ``universe`` must have a RangeIndex.
+        """
+        scanner = cls.__new__(cls)
+        scanner.universe = universe
+        scanner.version = next(_versions) if version is None else version
+        scanner._values = {c: universe[c].to_numpy() for c in INDEXED_COLUMNS}
+        scanner._order = {c: arrays[f"order/{c}"] for c in INDEXED_COLUMNS}
+        scanner._sorted = {c: arrays[f"sorted/{c}"] for c in INDEXED_COLUMNS}
+        scanner._categories = {
+            column: BitmapIndex(arrays[f"codes/{column}"], labels)
+            for column, labels in category_labels.items()
+        }
+        scanner._freeze()
+        return scanner
+
+    def __len__(self):
+        return len(self.universe)
+
+    @property
+    def sectors(self):
+        """Sorted list of sector names in the universe"""
+        return self._categories["Sector"].labels
+
+    @property
+    def sector_codes(self):
+        """Per-row position of the row's sector in ``sectors`` (read-only)"""
+        return self._categories["Sector"].codes
+
+    def categories(self, column):
+        """Sorted labels of a bitmap-indexed column, empty if it is missing"""
+        index = self._categories.get(column)
+        return [] if index is None else index.labels
+
+    def category_labels(self):
+        """``{column: labels}`` for every bitmap-indexed column"""
+        return {column: index.labels for column, index in self._categories.items()}
+
+    def category_bitmap(self, sectors=None, industries=None, exchanges=None):
+        """Packed bitmap of rows matching every category choice, or ``None``
+
+        Within a column the chosen labels' bitmaps are OR'd; across columns
+        the results are AND'd. ``None`` choices, choices of every label and
+        columns the universe lacks do not restrict, and when nothing
+        restricts the result is ``None``.
+        """
+        bitmap = None
+        for column, labels in zip(CATEGORY_COLUMNS, (sectors, industries, exchanges)):
+            index = self._categories.get(column)
+            selected = None if index is None else index.select(labels)
+            if selected is not None:
+                bitmap = selected if bitmap is None else bitmap & selected
+        return bitmap
+
+    def _bounds(self, column, lo=None, hi=None):
+        """Positions in the sorted index for ``lo <= value <= hi``
+
+        Bounds are cast to the column's dtype first, so float32 columns are
+        compared in float32 like the masks computed on the same values.
+        """
+        sorted_values = self._sorted[column]
+        cast = sorted_values.dtype.type
+        lo = None if lo is None else cast(lo)
+        hi = None if hi is None else cast(hi)
+        start = 0 if lo is None else np.searchsorted(sorted_values, lo, "left")
+        stop = (
+            len(sorted_values)
+            if hi is None
+            else np.searchsorted(sorted_values, hi, "right")
+        )
+        return start, max(start, stop)
+
+    def range_rows(self, column, lo=None, hi=None):
+        """Row ids with ``lo <= column <= hi``, ordered by that column"""
+        start, stop = self._bounds(column, lo, hi)
+        return self._order[column][start:stop]
+
+    def count(self, column, lo=None, hi=None):
+        """Number of rows with ``lo <= column <= hi`` without touching them"""
+        start, stop = self._bounds(column, lo, hi)
+        return stop - start
+
+    def filter_rows(
+        self,
+        sectors=None,
+        min_cap=None,
+        max_cap=None,
+        min_volume=None,
+        max_from_low=None,
+        industries=None,
+        exchanges=None,
+    ):
+        """Row ids passing every predicate
+
+        The narrowest candidate set, an indexed range or the rows set in the
+        category bitmap, is used and the other predicates are checked on it,
+        so the work is proportional to that set rather than to the universe.
+        When ``max_from_low`` is given the rows come back ordered by % From
+        Low, otherwise in universe order.
+        """
+        bitmap = self.category_bitmap(sectors, industries, exchanges)
+        ranges = {
+            "Market Cap (B)": (min_cap, max_cap),
+            "Volume (M)": (min_volume, None),
+            "% From Low": (None, max_from_low),
+        }
+        ranges = {c: r for c, r in ranges.items() if r != (None, None)}
+        if not ranges:
+            if bitmap is None:
+                return np.arange(len(self.universe))
+            return bitmap_rows(bitmap, len(self.universe))
+
+        counts = {c: self.count(c, *r) for c, r in ranges.items()}
+        driver = min(counts, key=counts.get)
+        if bitmap is not None and popcount(bitmap) < counts[driver]:
+            driver = None
+            rows = bitmap_rows(bitmap, len(self.universe))
+            keep = np.ones(len(rows), dtype=bool)
+        else:
+            rows = self.range_rows(driver, *ranges.pop(driver))
+            keep = (
+                np.ones(len(rows), dtype=bool)
+                if bitmap is None
+                else bitmap_test(bitmap, rows)
+            )
+
+        for column, (lo, hi) in ranges.items():
+            values = self._values[column][rows]
+            if lo is not None:
+                keep &= values >= lo
+            if hi is not None:
+                keep &= values <= hi
+        rows = rows[keep]
+
+        if max_from_low is None:
+            # Bitmap rows are already in universe order
+            return rows if driver is None else np.sort(rows)
+        if driver != "% From Low":
+            # Ties keep universe order, matching the % From Low index
+            rows = rows[np.lexsort((rows, self._values["% From Low"][rows]))]
+        return rows
+
+    def scan(
+        self,
+        sectors,
+        min_cap,
+        max_cap,
+        min_volume,
+        threshold,
+        industries=None,
+        exchanges=None,
+    ):
+        """Run the app's scan, returning ``(filtered_df, near_low_df)``
+
+        ``filtered_df`` is every row passing the category/cap/volume filters,
+        in universe order, with a boolean "Near Low" column; ``near_low_df``
+        is its near-low subset sorted by % From Low.
+        """
+        categories = {"industries": industries, "exchanges": exchanges}
+        filtered_rows = self.filter_rows(
+            sectors, min_cap, max_cap, min_volume, **categories
+        )
+        near_low_rows = self.filter_rows(
+            sectors, min_cap, max_cap, min_volume, threshold, **categories
+        )
+
+        filtered_df = self.universe.take(filtered_rows)
+        filtered_df["Near Low"] = self._values["% From Low"][filtered_rows] <= threshold
+        near_low_df = self.universe.take(near_low_rows)
+        near_low_df["Near Low"] = True
+        return filtered_df, near_low_df
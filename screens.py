@@ -0,0 +1,123 @@
+# screens.py
+from collections import namedtuple
+
+import numpy as np
+
+from ranking import top_k
+
+# Screen name -> label; every screen runs on the same prefiltered rows
+SCREENS = {
+    "near_low": "Near 52W Low",
+    "near_high": "Near 52W High",
+    "low_decile": "Bottom 10% of 52W Range",
+    "new_low": "New 52W Low Today",
+}
+
+# Candidate rows evaluated per block; keeps the gathered columns in cache
+BLOCK_ROWS = 65_536
+
+
+class ScreenHits(namedtuple("ScreenHits", ["rows", "keys"])):
+    """Rows passing a screen, in universe order, with their ranking keys"""
+
+    __slots__ = ()
+
+    def top(self, k):
+        """Row ids of the ``k`` best hits, best first, ties by row id"""
+        return self.rows[top_k(self.keys, k)]
+
+    def ordered(self):
+        """Every hit, best first"""
+        return self.top(len(self.rows))
+
+
+def run_screens(
+    universe,
+    rows,
+    low_threshold=5.0,
+    high_threshold=5.0,
+    range_fraction=0.1,
+    block_rows=BLOCK_ROWS,
+):
+    """Evaluate every screen on the prefiltered ``rows`` in one pass
+
+    The price, low, high and distance columns are gathered once per block
+    of candidate rows and all four predicates are computed from them
+    before moving on, instead of one full set of masks per screen:
+
+    - ``near_low``: % From Low <= ``low_threshold``
+    - ``near_high``: % From High >= -``high_threshold``
+    - ``low_decile``: price in the bottom ``range_fraction`` of the 52-week
+      range
+    - ``new_low``: price at or below the 52-week low
+
+    Returns ``{screen: ScreenHits}``. Hits stay in universe order with a
+    key where lower is better (distance from the low or high, range
+    position), so showing the top rows costs a partial selection rather
+    than a sort of every hit.
+    """
+    rows = np.asarray(rows)
+    columns = {
+        c: universe[c].to_numpy()
+        for c in ("Current Price", "52W Low", "52W High", "% From Low", "% From High")
+    }
+
+    hits = {name: [] for name in SCREENS}
+    keys = {name: [] for name in SCREENS}
+    for start in range(0, len(rows), block_rows):
+        block = rows[start : start + block_rows]
+        price = columns["Current Price"][block]
+        low = columns["52W Low"][block]
+        high = columns["52W High"][block]
+        from_low = columns["% From Low"][block]
+        from_high = columns["% From High"][block]
+
+        span = high - low
+        position = np.divide(
+            price - low, span, out=np.zeros(len(block)), where=span > 0
+        )
+        masks = {
+            "near_low": from_low <= low_threshold,
+            "near_high": from_high >= -high_threshold,
+            "low_decile": position <= range_fraction,
+            "new_low": price <= low,
+        }
+        sort_keys = {
+            "near_low": from_low,
+            "near_high": -from_high,
+            "low_decile": position,
+            "new_low": from_low,
+        }
+        for name, mask in masks.items():
+            hits[name].append(block[mask])
+            keys[name].append(sort_keys[name][mask])
+
+    return {
+        name: ScreenHits(
+            np.concatenate(hits[name]) if hits[name] else rows[:0],
+            np.concatenate(keys[name]) if keys[name] else np.empty(0),
+        )
+        for name in SCREENS
+    }
+
+
+def screen(
+    scanner,
+    sectors,
+    min_cap,
+    max_cap,
+    min_volume,
+    industries=None,
+    exchanges=None,
+    **thresholds,
+):
+    """Apply the app's category/cap/volume prefilter once, then run every screen"""
+    rows = scanner.filter_rows(
+        sectors,
+        min_cap,
+        max_cap,
+        min_volume,
+        industries=industries,
+        exchanges=exchanges,
+    )
+    return run_screens(scanner.universe, rows, **thresholds)
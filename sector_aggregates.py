@@ -0,0 +1,142 @@
+# sector_aggregates.py
+import numpy as np
+import pandas as pd
+
+
+class SectorAggregates:
+    """Per-sector count, sum, min, mean and near-low count of % From Low
+
+    Everything is accumulated with ``np.bincount`` over integer sector codes
+    in one pass. ``update`` takes the rows that pass the current filters; if
+    only a small part of the selection changed it adds and subtracts just
+    the changed rows, and only sectors that lost their minimum row rescan
+    for a new one.
+    """
+
+    def __init__(self, codes, labels, values):
+        self.codes = np.asarray(codes)
+        self.labels = list(labels)
+        # Kept as given (float32 in compact universes) so a store per
+        # session does not copy the column
+        self.values = np.asarray(values)
+        self.rows = None
+        self.threshold = None
+
+        k = len(self.labels)
+        self.count = np.zeros(k, dtype=np.int64)
+        self.sum = np.zeros(k)
+        self.min = np.full(k, np.inf)
+        self.near = np.zeros(k, dtype=np.int64)
+
+    @classmethod
+    def from_scanner(cls, scanner, values=None):
+        """Aggregates over a Scanner's universe, reusing its sector codes
+
+        ``values`` replaces the universe's % From Low, e.g. with a re-priced
+        copy of the same rows.
+        """
+        if values is None:
+            values = scanner.universe["% From Low"].to_numpy()
+        return cls(scanner.sector_codes, scanner.sectors, values)
+
+    def _accumulate(self, rows, sign):
+        k = len(self.labels)
+        codes = self.codes[rows]
+        values = self.values[rows]
+        self.count += sign * np.bincount(codes, minlength=k)
+        self.sum += sign * np.bincount(codes, weights=values, minlength=k)
+        self.near += sign * np.bincount(codes[values <= self.threshold], minlength=k)
+
+    def _recompute_min(self, rows, sectors=None):
+        mins = np.full(len(self.labels), np.inf)
+        np.minimum.at(mins, self.codes[rows], self.values[rows])
+        if sectors is None:
+            self.min = mins
+        else:
+            self.min[sectors] = mins[sectors]
+
+    def _rebuild(self, rows, threshold):
+        self.threshold = threshold
+        self.count[:] = 0
+        self.sum[:] = 0
+        self.near[:] = 0
+        self._accumulate(rows, 1)
+        self._recompute_min(rows)
+
+    def update(self, rows, threshold):
+        """Bring the aggregates to the selection ``rows`` (sorted row ids)"""
+        rows = np.asarray(rows)
+        if self.rows is None:
+            self._rebuild(rows, threshold)
+            self.rows = rows
+            return self
+
+        added = np.setdiff1d(rows, self.rows, assume_unique=True)
+        removed = np.setdiff1d(self.rows, rows, assume_unique=True)
+        if len(added) + len(removed) > len(rows) // 2:
+            self._rebuild(rows, threshold)
+            self.rows = rows
+            return self
+
+        # Removed rows were counted under the old threshold, so go first
+        if len(removed):
+            self._accumulate(removed, -1)
+            # A sector whose minimum row left has to look for a new minimum
+            lost = np.unique(
+                self.codes[removed][
+                    self.values[removed] <= self.min[self.codes[removed]]
+                ]
+            )
+            if len(lost):
+                self._recompute_min(rows, lost)
+        if threshold != self.threshold:
+            # Only rows between the old and new threshold change near-low state
+            k = len(self.labels)
+            lo, hi = sorted((self.threshold, threshold))
+            kept = np.intersect1d(rows, self.rows, assume_unique=True)
+            values = self.values[kept]
+            moved = kept[(values > lo) & (values <= hi)]
+            sign = 1 if threshold > self.threshold else -1
+            self.near += sign * np.bincount(self.codes[moved], minlength=k)
+            self.threshold = threshold
+
+        if len(added):
+            self._accumulate(added, 1)
+            np.minimum.at(self.min, self.codes[added], self.values[added])
+
+        self.rows = rows
+        return self
+
+    @property
+    def total_count(self):
+        return int(self.count.sum())
+
+    @property
+    def total_near(self):
+        return int(self.near.sum())
+
+    @property
+    def overall_mean(self):
+        total = self.count.sum()
+        return float(self.sum.sum() / total) if total else float("nan")
+
+    @property
+    def overall_min(self):
+        return float(self.min.min()) if self.total_count else float("nan")
+
+    def frame(self):
+        """One row per sector present in the selection"""
+        present = self.count > 0
+        count = self.count[present]
+        return pd.DataFrame(
+            {
+                "Count": count,
+                "Sum % From Low": self.sum[present],
+                "Min % From Low": self.min[present],
+                "Mean % From Low": self.sum[present] / count,
+                "Near Low": self.near[present],
+            },
+            index=pd.Index(
+                np.asarray(self.labels, dtype=object)[present], name="Sector"
+            ),
+        )
@@ -0,0 +1,247 @@
+# shared_universe.py
+"""Publish the indexed universe once per host and attach to it from any process
+
+Example:
+    python shared_universe.py --n-stocks 1000000   # publish a new version
+"""
+
+import argparse
+import fcntl
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+from data_generator import N_STOCKS_HELP, universe_size
+from scanner import Scanner
+from snapshot import SNAPSHOT_DIR, load_universe, snapshot_key
+
+# Index arrays are stored as extra columns under this prefix
+INDEX_PREFIX = "__index__/"
+
+# Strings load as Arrow-backed views of the mapped file, not Python objects;
+# pandas' pyarrow strings are stored as large_string
+_STRING_DTYPES = {
+    pa.string(): pd.ArrowDtype(pa.string()),
+    pa.large_string(): pd.ArrowDtype(pa.large_string()),
+}
+
+
+def _version_path(name, version, directory):
+    return Path(directory) / f"{name}-v{version:06d}.arrow"
+
+
+def _pointer_path(name, directory):
+    return Path(directory) / f"{name}.current"
+
+
+@contextmanager
+def _locked(name, directory):
+    """Hold the exclusive per-name lock that guards the pointer file"""
+    with open(Path(directory) / f"{name}.lock", "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def current_version(name, directory=SNAPSHOT_DIR):
+    """Latest published version of ``name``, or 0 if there is none"""
+    try:
+        return json.loads(_pointer_path(name, directory).read_text())["version"]
+    except FileNotFoundError:
+        return 0
+
+
+def publish(universe, name, directory=SNAPSHOT_DIR):
+    """Write the universe and its Scanner indexes as the next version of ``name``
+
+    The versioned file is written in full before the pointer file is
+    atomically replaced, so attaching processes see either the old version
+    or the new one, never a partial file. The pointer only moves forward:
+    if a concurrent publisher already pointed it at a later version, this
+    version is written but not made current. Returns the new version number.
+    """
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    version, path = _write_version(universe, name, directory)
+    with _locked(name, directory):
+        _point_to(name, version, path, directory)
+    return version
+
+
+def _write_version(universe, name, directory):
+    """Claim the next free version number and write the universe under it"""
+    scanner = Scanner(universe)
+
+    table = pa.Table.from_pandas(scanner.universe, preserve_index=False)
+    for key, array in scanner.index_arrays().items():
+        table = table.append_column(INDEX_PREFIX + key, pa.array(array))
+    table = table.replace_schema_metadata(
+        {
+            **(table.schema.metadata or {}),
+            b"category_labels": json.dumps(scanner.category_labels()).encode(),
+        }
+    )
+
+    # Claim the next free version number; concurrent publishers skip ahead
+    version = current_version(name, directory)
+    while True:
+        version += 1
+        path = _version_path(name, version, directory)
+        try:
+            os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            break
+        except FileExistsError:
+            continue
+
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with pa.OSFile(str(tmp_path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, path)
+    return version, path
+
+
+def _point_to(name, version, path, directory):
+    """Make ``version`` current unless a later one is; call under ``_locked``"""
+    if version <= current_version(name, directory):
+        return
+    pointer = _pointer_path(name, directory)
+    tmp_pointer = pointer.with_suffix(f".{os.getpid()}.tmp")
+    tmp_pointer.write_text(json.dumps({"version": version, "file": path.name}))
+    os.replace(tmp_pointer, pointer)
+
+
+def _index_array(column):
+    """A stored index column as a numpy view; several chunks are joined (copied)"""
+    if column.num_chunks == 1:
+        return column.chunk(0).to_numpy(zero_copy_only=True)
+    return column.combine_chunks().to_numpy()
+
+
+def attach(name, version=None, directory=SNAPSHOT_DIR):
+    """Memory-map a published version (the latest by default) as a Scanner
+
+    Numeric and string columns and the index arrays are zero-copy views of
+    the mapped file, so every process attached to a version shares one copy
+    in the page cache and attaching does no sorting.
+    """
+    version = current_version(name, directory) if version is None else version
+    if not version:
+        raise FileNotFoundError(f"No published universe named {name!r}")
+
+    with pa.memory_map(str(_version_path(name, version, directory)), "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+
+    columns = [c for c in table.column_names if not c.startswith(INDEX_PREFIX)]
+    universe = table.select(columns).to_pandas(
+        split_blocks=True, types_mapper=_STRING_DTYPES.get
+    )
+    arrays = {
+        c[len(INDEX_PREFIX) :]: _index_array(table.column(c))
+        for c in table.column_names
+        if c.startswith(INDEX_PREFIX)
+    }
+    labels = json.loads(table.schema.metadata[b"category_labels"])
+    return Scanner.from_index(universe, arrays, labels, version=f"{name}-v{version}")
+
+
+def prune(name, keep=2, directory=SNAPSHOT_DIR):
+    """Delete all but the newest ``keep`` versions
+
+    Processes still mapping a deleted file keep reading it until they
+    attach to a newer version.
+    """
+    latest = current_version(name, directory)
+    for path in Path(directory).glob(f"{name}-v*.arrow"):
+        version = int(path.stem.rsplit("-v", 1)[1])
+        if version <= latest - keep:
+            path.unlink(missing_ok=True)
+
+
+class SharedUniverse:
+    """The latest published universe for this process, re-attached on a new version
+
+    ``scanner()`` costs one small file read while the version is unchanged,
+    and swaps to the new version's Scanner in one step when it changes.
+    """
+
+    def __init__(self, name, directory=SNAPSHOT_DIR, check_interval=1.0):
+        self.name = name
+        self.directory = directory
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        version = current_version(name, directory)
+        # Swapped as one tuple so readers never see a mismatched pair
+        self._current = (version, attach(name, version, directory))
+        self._checked = time.monotonic()
+
+    @classmethod
+    def attach_or_publish(cls, n_stocks=None, seed=42, compact=False, **kwargs):
+        """Attach to the universe for these generator parameters, publishing if new
+
+        Processes starting together publish it once: the first takes the
+        lock and publishes, the rest wait for it and then attach.
+        """
+        n_stocks = universe_size(n_stocks)
+        name = snapshot_key(n_stocks=n_stocks, seed=seed, compact=compact)
+        directory = kwargs.get("directory", SNAPSHOT_DIR)
+        if not current_version(name, directory):
+            Path(directory).mkdir(parents=True, exist_ok=True)
+            with _locked(name, directory):
+                if not current_version(name, directory):
+                    universe = load_universe(
+                        n_stocks=n_stocks, seed=seed, compact=compact
+                    )
+                    version, path = _write_version(universe, name, directory)
+                    _point_to(name, version, path, directory)
+        return cls(name, **kwargs)
+
+    @property
+    def version(self):
+        """Published version number currently attached"""
+        return self._current[0]
+
+    def scanner(self):
+        """Scanner for the newest version, checked every ``check_interval`` seconds"""
+        if time.monotonic() - self._checked < self.check_interval:
+            return self._current[1]
+        with self._lock:
+            self._checked = time.monotonic()
+            latest = current_version(self.name, self.directory)
+            if latest != self._current[0]:
+                self._current = (latest, attach(self.name, latest, self.directory))
+        return self._current[1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n-stocks", type=int, default=None, help=N_STOCKS_HELP)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-compact", dest="compact", action="store_false")
+    parser.add_argument("--keep", type=int, default=2, help="Versions to keep")
+    parser.add_argument("--directory", type=Path, default=SNAPSHOT_DIR)
+    args = parser.parse_args(argv)
+
+    args.n_stocks = universe_size(args.n_stocks)
+    name = snapshot_key(n_stocks=args.n_stocks, seed=args.seed, compact=args.compact)
+    start = time.perf_counter()
+    universe = load_universe(
+        n_stocks=args.n_stocks, seed=args.seed, compact=args.compact
+    )
+    version = publish(universe, name, args.directory)
+    prune(name, args.keep, args.directory)
+    print(
+        f"Published {name} v{version} ({len(universe):,} rows) "
+        f"in {time.perf_counter() - start:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# snapshot.py
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pyarrow as pa
+
+from data_generator import generate_stock_universe, universe_size
+
+# Bump when the on-disk layout or the generator output changes shape
+SNAPSHOT_FORMAT = 4
+
+SNAPSHOT_DIR = Path(os.environ.get("SCANNER_SNAPSHOT_DIR", ".snapshots"))
+
+
+def snapshot_key(**params):
+    """Stable short hash of the generator parameters"""
+    payload = json.dumps(
+        {"format": SNAPSHOT_FORMAT, **params}, sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def snapshot_path(n_stocks=None, seed=42, compact=False, directory=SNAPSHOT_DIR):
+    """Path of the snapshot file for a given set of generator parameters"""
+    key = snapshot_key(n_stocks=universe_size(n_stocks), seed=seed, compact=compact)
+    return Path(directory) / f"universe-{key}.arrow"
+
+
+def write_snapshot(df, path):
+    """Write a universe frame to an Arrow IPC file atomically"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    # Write next to the target and rename, so readers never see a partial file
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with pa.OSFile(str(tmp_path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_snapshot(path):
+    """Memory-map an Arrow IPC snapshot and return it as a DataFrame"""
+    with pa.memory_map(str(path), "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    return table.to_pandas(split_blocks=True)
+
+
+def load_universe(n_stocks=None, seed=42, compact=False, directory=SNAPSHOT_DIR):
+    """Load the universe from its snapshot, generating and writing it on a miss
+
+    The file name is keyed by the generator parameters, so changing
+    ``n_stocks``, ``seed``, ``compact`` (or ``SNAPSHOT_FORMAT``) picks a new
+    snapshot.
+    """
+    if seed is None:
+        # Unseeded universes are never the same twice, so don't cache them
+        return generate_stock_universe(n_stocks=n_stocks, seed=None, compact=compact)
+
+    path = snapshot_path(
+        n_stocks=n_stocks, seed=seed, compact=compact, directory=directory
+    )
+    if not path.exists():
+        df = generate_stock_universe(n_stocks=n_stocks, seed=seed, compact=compact)
+        write_snapshot(df, path)
+    return read_snapshot(path)
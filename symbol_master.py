@@ -0,0 +1,931 @@
+# symbol_master.py
+import zlib
+from collections import namedtuple
+from functools import lru_cache
+
+import pandas as pd
+
+# REAL stock symbols by sector (all actual NYSE/NASDAQ tickers)
+# A few tickers appear under more than one sector; the first listing wins.
+SECTOR_TICKERS = {
+    "Technology": [
+        "AAPL",
+        "MSFT",
+        "GOOGL",
+        "AMZN",
+        "META",
+        "NVDA",
+        "TSLA",
+        "ADBE",
+        "CRM",
+        "INTC",
+        "CSCO",
+        "ORCL",
+        "IBM",
+        "QCOM",
+        "AMD",
+        "NOW",
+        "SNOW",
+        "NET",
+        "CRWD",
+        "PANW",
+        "ZS",
+        "DDOG",
+        "MDB",
+        "PLTR",
+        "UBER",
+        "SHOP",
+        "SQ",
+        "ROKU",
+        "ZM",
+        "DOCU",
+        "FTNT",
+        "OKTA",
+        "TEAM",
+        "SPLK",
+        "HUBS",
+        "TWLO",
+        "TTD",
+        "PYPL",
+        "NFLX",
+        "DIS",
+    ],
+    "Healthcare": [
+        "JNJ",
+        "UNH",
+        "PFE",
+        "ABT",
+        "TMO",
+        "LLY",
+        "ABBV",
+        "DHR",
+        "MDT",
+        "BMY",
+        "AMGN",
+        "GILD",
+        "VRTX",
+        "REGN",
+        "ISRG",
+        "DXCM",
+        "IDXX",
+        "BSX",
+        "ZTS",
+        "SYK",
+        "CVS",
+        "WBA",
+        "CI",
+        "HUM",
+        "ELV",
+        "MCK",
+        "ABC",
+        "CAH",
+        "EW",
+        "BIIB",
+        "ALGN",
+        "ILMN",
+        "MTD",
+        "WST",
+        "RMD",
+        "STE",
+        "WAT",
+        "PKI",
+        "DGX",
+        "LH",
+    ],
+    "Financials": [
+        "JPM",
+        "BAC",
+        "WFC",
+        "C",
+        "GS",
+        "MS",
+        "SCHW",
+        "BLK",
+        "AXP",
+        "V",
+        "MA",
+        "PYPL",
+        "COF",
+        "USB",
+        "PNC",
+        "TFC",
+        "BK",
+        "STT",
+        "MMC",
+        "SPGI",
+        "ICE",
+        "CME",
+        "NDAQ",
+        "MCO",
+        "FIS",
+        "FISV",
+        "GPN",
+        "JKHY",
+        "SYF",
+        "ALLY",
+        "RF",
+        "KEY",
+        "HBAN",
+        "CFG",
+        "MTB",
+        "ZION",
+        "FHN",
+        "BKU",
+        "WBS",
+        "SNV",
+    ],
+    "Consumer": [
+        "PG",
+        "KO",
+        "PEP",
+        "WMT",
+        "COST",
+        "TGT",
+        "HD",
+        "LOW",
+        "NKE",
+        "MCD",
+        "SBUX",
+        "DIS",
+        "CMCSA",
+        "T",
+        "VZ",
+        "TMUS",
+        "CHTR",
+        "ATVI",
+        "EA",
+        "TTWO",
+        "LULU",
+        "ULTA",
+        "ROST",
+        "TJX",
+        "DG",
+        "DLTR",
+        "FIVE",
+        "BURL",
+        "CASY",
+        "KR",
+        "SYY",
+        "HSY",
+        "K",
+        "GIS",
+        "CPB",
+        "KHC",
+        "MDLZ",
+        "STZ",
+        "BF.B",
+        "MO",
+    ],
+    "Industrial": [
+        "BA",
+        "CAT",
+        "GE",
+        "HON",
+        "UPS",
+        "FDX",
+        "RTX",
+        "LMT",
+        "GD",
+        "NOC",
+        "DE",
+        "EMR",
+        "ITW",
+        "ETN",
+        "ROK",
+        "TT",
+        "CPRT",
+        "CSX",
+        "UNP",
+        "NSC",
+        "PCAR",
+        "WM",
+        "RSG",
+        "WCN",
+        "AWK",
+        "AEP",
+        "DUK",
+        "SO",
+        "NEE",
+        "D",
+        "EXC",
+        "SRE",
+        "XEL",
+        "WEC",
+        "ES",
+        "EIX",
+        "PEG",
+        "AEE",
+        "LNT",
+        "ED",
+    ],
+    "Energy": [
+        "XOM",
+        "CVX",
+        "COP",
+        "SLB",
+        "EOG",
+        "PSX",
+        "MPC",
+        "VLO",
+        "KMI",
+        "WMB",
+        "OXY",
+        "HAL",
+        "BKR",
+        "FANG",
+        "PXD",
+        "EQT",
+        "DVN",
+        "MTDR",
+        "MRO",
+        "APA",
+        "OKE",
+        "TRP",
+        "ENB",
+        "EPD",
+        "ET",
+        "MPLX",
+        "PAA",
+        "LNG",
+        "NOV",
+        "FTI",
+        "NBR",
+        "HP",
+        "PTEN",
+        "PUMP",
+        "WFRD",
+        "TDW",
+        "RIG",
+        "VAL",
+        "FTI",
+        "HP",
+    ],
+}
+
+# Real tickers outside the sector lists above
+ADDITIONAL_TICKERS = {
+    "F": "Consumer",  # Auto
+    "GM": "Consumer",  # Auto
+    "MRK": "Healthcare",  # Pharma
+}
+
+# Major companies with known names
+KNOWN_NAMES = {
+    "AAPL": "Apple Inc.",
+    "MSFT": "Microsoft Corp.",
+    "GOOGL": "Alphabet Inc.",
+    "AMZN": "Amazon.com Inc.",
+    "META": "Meta Platforms Inc.",
+    "NVDA": "NVIDIA Corp.",
+    "TSLA": "Tesla Inc.",
+    "JNJ": "Johnson & Johnson",
+    "JPM": "JPMorgan Chase & Co.",
+    "V": "Visa Inc.",
+    "PG": "Procter & Gamble Co.",
+    "UNH": "UnitedHealth Group Inc.",
+    "HD": "Home Depot Inc.",
+    "DIS": "Walt Disney Co.",
+    "BAC": "Bank of America Corp.",
+    "MA": "Mastercard Inc.",
+    "XOM": "Exxon Mobil Corp.",
+    "CVX": "Chevron Corp.",
+    "PFE": "Pfizer Inc.",
+    "ABT": "Abbott Laboratories",
+    "WMT": "Walmart Inc.",
+    "KO": "Coca-Cola Co.",
+    "PEP": "PepsiCo Inc.",
+    "CSCO": "Cisco Systems Inc.",
+    "INTC": "Intel Corp.",
+    "IBM": "International Business Machines Corp.",
+    "ORCL": "Oracle Corp.",
+    "QCOM": "Qualcomm Inc.",
+    "AMD": "Advanced Micro Devices Inc.",
+    "ADBE": "Adobe Inc.",
+    "CRM": "Salesforce Inc.",
+    "NFLX": "Netflix Inc.",
+    "PYPL": "PayPal Holdings Inc.",
+    "COST": "Costco Wholesale Corp.",
+    "TMO": "Thermo Fisher Scientific Inc.",
+    "ABBV": "AbbVie Inc.",
+    "LLY": "Eli Lilly & Co.",
+    "DHR": "Danaher Corp.",
+    "MDT": "Medtronic plc",
+    "BMY": "Bristol-Myers Squibb Co.",
+    "AMGN": "Amgen Inc.",
+    "T": "AT&T Inc.",
+    "VZ": "Verizon Communications Inc.",
+    "CMCSA": "Comcast Corp.",
+    "NKE": "Nike Inc.",
+    "MCD": "McDonald's Corp.",
+    "SBUX": "Starbucks Corp.",
+    "BA": "Boeing Co.",
+    "CAT": "Caterpillar Inc.",
+    "GE": "General Electric Co.",
+    "HON": "Honeywell International Inc.",
+    "UPS": "United Parcel Service Inc.",
+    "FDX": "FedEx Corp.",
+    "RTX": "Raytheon Technologies Corp.",
+    "LMT": "Lockheed Martin Corp.",
+    "GD": "General Dynamics Corp.",
+    "NOC": "Northrop Grumman Corp.",
+    "DE": "Deere & Co.",
+    "CSX": "CSX Corp.",
+    "UNP": "Union Pacific Corp.",
+    "NSC": "Norfolk Southern Corp.",
+    "LOW": "Lowe's Companies Inc.",
+    "TGT": "Target Corp.",
+    "WBA": "Walgreens Boots Alliance Inc.",
+    "CVS": "CVS Health Corp.",
+    "CI": "Cigna Corp.",
+    "HUM": "Humana Inc.",
+    "ELV": "Elevance Health Inc.",
+    "MCK": "McKesson Corp.",
+    "ABC": "AmerisourceBergen Corp.",
+    "CAH": "Cardinal Health Inc.",
+    "GS": "Goldman Sachs Group Inc.",
+    "MS": "Morgan Stanley",
+    "BLK": "BlackRock Inc.",
+    "AXP": "American Express Co.",
+    "SPGI": "S&P Global Inc.",
+    "ICE": "Intercontinental Exchange Inc.",
+    "CME": "CME Group Inc.",
+    "NDAQ": "Nasdaq Inc.",
+    "MCO": "Moody's Corp.",
+    "FIS": "Fidelity National Information Services Inc.",
+    "FISV": "Fiserv Inc.",
+    "GPN": "Global Payments Inc.",
+    "NOW": "ServiceNow Inc.",
+    "SNOW": "Snowflake Inc.",
+    "NET": "Cloudflare Inc.",
+    "CRWD": "CrowdStrike Holdings Inc.",
+    "PANW": "Palo Alto Networks Inc.",
+    "ZS": "Zscaler Inc.",
+    "DDOG": "Datadog Inc.",
+    "MDB": "MongoDB Inc.",
+    "PLTR": "Palantir Technologies Inc.",
+    "UBER": "Uber Technologies Inc.",
+    "SHOP": "Shopify Inc.",
+    "SQ": "Block Inc.",
+    "ROKU": "Roku Inc.",
+    "ZM": "Zoom Video Communications Inc.",
+    "DOCU": "DocuSign Inc.",
+    "FTNT": "Fortinet Inc.",
+    "OKTA": "Okta Inc.",
+    "TEAM": "Atlassian Corp.",
+    "SPLK": "Splunk Inc.",
+    "HUBS": "HubSpot Inc.",
+    "TWLO": "Twilio Inc.",
+    "TTD": "The Trade Desk Inc.",
+    "ISRG": "Intuitive Surgical Inc.",
+    "VRTX": "Vertex Pharmaceuticals Inc.",
+    "REGN": "Regeneron Pharmaceuticals Inc.",
+    "DXCM": "Dexcom Inc.",
+    "IDXX": "IDEXX Laboratories Inc.",
+    "ALGN": "Align Technology Inc.",
+    "ILMN": "Illumina Inc.",
+    "MTD": "Mettler-Toledo International Inc.",
+    "WST": "West Pharmaceutical Services Inc.",
+    "RMD": "ResMed Inc.",
+    "STE": "Steris plc",
+    "WAT": "Waters Corp.",
+    "PKI": "PerkinElmer Inc.",
+    "DGX": "Quest Diagnostics Inc.",
+    "LH": "Laboratory Corp. of America Holdings",
+    "EW": "Edwards Lifesciences Corp.",
+    "BIIB": "Biogen Inc.",
+    "SYK": "Stryker Corp.",
+    "ZTS": "Zoetis Inc.",
+    "BSX": "Boston Scientific Corp.",
+    "LULU": "Lululemon Athletica Inc.",
+    "ULTA": "Ulta Beauty Inc.",
+    "ROST": "Ross Stores Inc.",
+    "TJX": "TJX Companies Inc.",
+    "DG": "Dollar General Corp.",
+    "DLTR": "Dollar Tree Inc.",
+    "FIVE": "Five Below Inc.",
+    "BURL": "Burlington Stores Inc.",
+    "CASY": "Casey's General Stores Inc.",
+    "KR": "Kroger Co.",
+    "SYY": "Sysco Corp.",
+    "HSY": "Hershey Co.",
+    "K": "Kellogg Co.",
+    "GIS": "General Mills Inc.",
+    "CPB": "Campbell Soup Co.",
+    "KHC": "Kraft Heinz Co.",
+    "MDLZ": "Mondelez International Inc.",
+    "STZ": "Constellation Brands Inc.",
+    "BF.B": "Brown-Forman Corp.",
+    "MO": "Altria Group Inc.",
+    "PCAR": "PACCAR Inc.",
+    "WM": "Waste Management Inc.",
+    "RSG": "Republic Services Inc.",
+    "WCN": "Waste Connections Inc.",
+    "AWK": "American Water Works Co. Inc.",
+    "AEP": "American Electric Power Co. Inc.",
+    "DUK": "Duke Energy Corp.",
+    "SO": "Southern Co.",
+    "NEE": "NextEra Energy Inc.",
+    "D": "Dominion Energy Inc.",
+    "EXC": "Exelon Corp.",
+    "SRE": "Sempra Energy",
+    "XEL": "Xcel Energy Inc.",
+    "WEC": "WEC Energy Group Inc.",
+    "ES": "Eversource Energy",
+    "EIX": "Edison International",
+    "PEG": "Public Service Enterprise Group Inc.",
+    "AEE": "Ameren Corp.",
+    "LNT": "Alliant Energy Corp.",
+    "ED": "Consolidated Edison Inc.",
+    "OKE": "ONEOK Inc.",
+    "TRP": "TC Energy Corp.",
+    "ENB": "Enbridge Inc.",
+    "EPD": "Enterprise Products Partners L.P.",
+    "ET": "Energy Transfer L.P.",
+    "MPLX": "MPLX L.P.",
+    "PAA": "Plains All American Pipeline L.P.",
+    "LNG": "Cheniere Energy Inc.",
+    "NOV": "NOV Inc.",
+    "FTI": "TechnipFMC plc",
+    "NBR": "Nabors Industries Ltd.",
+    "HP": "Helmerich & Payne Inc.",
+    "PTEN": "Patterson-UTI Energy Inc.",
+    "PUMP": "ProPetro Holding Corp.",
+    "WFRD": "Weatherford International plc",
+    "TDW": "Tidewater Inc.",
+    "RIG": "Transocean Ltd.",
+    "VAL": "Valaris Ltd.",
+    "FANG": "Diamondback Energy Inc.",
+    "PXD": "Pioneer Natural Resources Co.",
+    "EQT": "EQT Corp.",
+    "DVN": "Devon Energy Corp.",
+    "MTDR": "Matador Resources Co.",
+    "MRO": "Marathon Oil Corp.",
+    "APA": "APA Corp.",
+    "OXY": "Occidental Petroleum Corp.",
+    "HAL": "Halliburton Co.",
+    "BKR": "Baker Hughes Co.",
+    "SLB": "Schlumberger Ltd.",
+    "EOG": "EOG Resources Inc.",
+    "PSX": "Phillips 66",
+    "MPC": "Marathon Petroleum Corp.",
+    "VLO": "Valero Energy Corp.",
+    "KMI": "Kinder Morgan Inc.",
+    "WMB": "Williams Companies Inc.",
+    "COP": "ConocoPhillips",
+    "ATVI": "Activision Blizzard Inc.",
+    "EA": "Electronic Arts Inc.",
+    "TTWO": "Take-Two Interactive Software Inc.",
+    "CHTR": "Charter Communications Inc.",
+    "TMUS": "T-Mobile US Inc.",
+    "F": "Ford Motor Co.",
+    "GM": "General Motors Co.",
+    "MRK": "Merck & Co. Inc.",
+}
+
+# Words used to build names for tickers without a known company name
+SECTOR_KEYWORDS = {
+    "Technology": [
+        "Tech",
+        "Technologies",
+        "Software",
+        "Systems",
+        "Digital",
+        "Cloud",
+        "Data",
+    ],
+    "Healthcare": [
+        "Health",
+        "Medical",
+        "Pharmaceuticals",
+        "Bio",
+        "Care",
+        "Therapeutics",
+    ],
+    "Financials": [
+        "Financial",
+        "Capital",
+        "Group",
+        "Holdings",
+        "Bank",
+        "Trust",
+        "Services",
+    ],
+    "Consumer": ["Brands", "Consumer", "Goods", "Retail", "Stores", "Products"],
+    "Industrial": [
+        "Industries",
+        "Industrial",
+        "Manufacturing",
+        "Engineering",
+        "Solutions",
+    ],
+    "Energy": ["Energy", "Resources", "Petroleum", "Oil", "Gas", "Power"],
+}
+
+# Sub-sectors synthetic tickers are filed under; drawn per ticker like the names
+SECTOR_INDUSTRIES = {
+    "Technology": ["Software", "Semiconductors", "Internet", "Hardware", "IT Services"],
+    "Healthcare": [
+        "Pharmaceuticals",
+        "Biotechnology",
+        "Medical Devices",
+        "Life Sciences Tools",
+        "Managed Care",
+        "Providers",
+        "Healthcare Distributors",
+    ],
+    "Financials": [
+        "Banks",
+        "Insurance",
+        "Asset Management",
+        "Capital Markets",
+        "Exchanges & Data",
+        "Payments",
+    ],
+    "Consumer": [
+        "Retail",
+        "Food & Beverage",
+        "Household Products",
+        "Restaurants",
+        "Media",
+        "Apparel",
+        "Telecom",
+        "Autos",
+        "Tobacco",
+    ],
+    "Industrial": [
+        "Aerospace & Defense",
+        "Machinery",
+        "Electrical Equipment",
+        "Conglomerates",
+        "Transportation",
+        "Environmental Services",
+        "Commercial Services",
+        "Utilities",
+    ],
+    "Energy": ["Oil & Gas", "Midstream", "Refining", "Oilfield Services", "Renewables"],
+}
+
+EXCHANGES = ["NYSE", "NASDAQ"]
+
+# Industry and primary listing of the real tickers (as of the December 2024
+# sample data); industries may cross the sector a ticker is filed under
+TICKER_PROFILES = {
+    "AAPL": ("Hardware", "NASDAQ"),
+    "MSFT": ("Software", "NASDAQ"),
+    "GOOGL": ("Internet", "NASDAQ"),
+    "AMZN": ("Internet", "NASDAQ"),
+    "META": ("Internet", "NASDAQ"),
+    "NVDA": ("Semiconductors", "NASDAQ"),
+    "TSLA": ("Autos", "NASDAQ"),
+    "ADBE": ("Software", "NASDAQ"),
+    "CRM": ("Software", "NYSE"),
+    "INTC": ("Semiconductors", "NASDAQ"),
+    "CSCO": ("Hardware", "NASDAQ"),
+    "ORCL": ("Software", "NYSE"),
+    "IBM": ("IT Services", "NYSE"),
+    "QCOM": ("Semiconductors", "NASDAQ"),
+    "AMD": ("Semiconductors", "NASDAQ"),
+    "NOW": ("Software", "NYSE"),
+    "SNOW": ("Software", "NYSE"),
+    "NET": ("Software", "NYSE"),
+    "CRWD": ("Software", "NASDAQ"),
+    "PANW": ("Software", "NASDAQ"),
+    "ZS": ("Software", "NASDAQ"),
+    "DDOG": ("Software", "NASDAQ"),
+    "MDB": ("Software", "NASDAQ"),
+    "PLTR": ("Software", "NASDAQ"),
+    "UBER": ("Internet", "NYSE"),
+    "SHOP": ("Internet", "NYSE"),
+    "SQ": ("Payments", "NYSE"),
+    "ROKU": ("Media", "NASDAQ"),
+    "ZM": ("Software", "NASDAQ"),
+    "DOCU": ("Software", "NASDAQ"),
+    "FTNT": ("Software", "NASDAQ"),
+    "OKTA": ("Software", "NASDAQ"),
+    "TEAM": ("Software", "NASDAQ"),
+    "SPLK": ("Software", "NASDAQ"),
+    "HUBS": ("Software", "NYSE"),
+    "TWLO": ("Software", "NYSE"),
+    "TTD": ("Software", "NASDAQ"),
+    "PYPL": ("Payments", "NASDAQ"),
+    "NFLX": ("Media", "NASDAQ"),
+    "DIS": ("Media", "NYSE"),
+    "JNJ": ("Pharmaceuticals", "NYSE"),
+    "UNH": ("Managed Care", "NYSE"),
+    "PFE": ("Pharmaceuticals", "NYSE"),
+    "ABT": ("Medical Devices", "NYSE"),
+    "TMO": ("Life Sciences Tools", "NYSE"),
+    "LLY": ("Pharmaceuticals", "NYSE"),
+    "ABBV": ("Pharmaceuticals", "NYSE"),
+    "DHR": ("Life Sciences Tools", "NYSE"),
+    "MDT": ("Medical Devices", "NYSE"),
+    "BMY": ("Pharmaceuticals", "NYSE"),
+    "AMGN": ("Biotechnology", "NASDAQ"),
+    "GILD": ("Biotechnology", "NASDAQ"),
+    "VRTX": ("Biotechnology", "NASDAQ"),
+    "REGN": ("Biotechnology", "NASDAQ"),
+    "ISRG": ("Medical Devices", "NASDAQ"),
+    "DXCM": ("Medical Devices", "NASDAQ"),
+    "IDXX": ("Medical Devices", "NASDAQ"),
+    "BSX": ("Medical Devices", "NYSE"),
+    "ZTS": ("Pharmaceuticals", "NYSE"),
+    "SYK": ("Medical Devices", "NYSE"),
+    "CVS": ("Providers", "NYSE"),
+    "WBA": ("Retail", "NASDAQ"),
+    "CI": ("Managed Care", "NYSE"),
+    "HUM": ("Managed Care", "NYSE"),
+    "ELV": ("Managed Care", "NYSE"),
+    "MCK": ("Healthcare Distributors", "NYSE"),
+    "ABC": ("Healthcare Distributors", "NYSE"),
+    "CAH": ("Healthcare Distributors", "NYSE"),
+    "EW": ("Medical Devices", "NYSE"),
+    "BIIB": ("Biotechnology", "NASDAQ"),
+    "ALGN": ("Medical Devices", "NASDAQ"),
+    "ILMN": ("Life Sciences Tools", "NASDAQ"),
+    "MTD": ("Life Sciences Tools", "NYSE"),
+    "WST": ("Medical Devices", "NYSE"),
+    "RMD": ("Medical Devices", "NYSE"),
+    "STE": ("Medical Devices", "NYSE"),
+    "WAT": ("Life Sciences Tools", "NYSE"),
+    "PKI": ("Life Sciences Tools", "NYSE"),
+    "DGX": ("Providers", "NYSE"),
+    "LH": ("Providers", "NYSE"),
+    "MRK": ("Pharmaceuticals", "NYSE"),
+    "JPM": ("Banks", "NYSE"),
+    "BAC": ("Banks", "NYSE"),
+    "WFC": ("Banks", "NYSE"),
+    "C": ("Banks", "NYSE"),
+    "GS": ("Capital Markets", "NYSE"),
+    "MS": ("Capital Markets", "NYSE"),
+    "SCHW": ("Capital Markets", "NYSE"),
+    "BLK": ("Asset Management", "NYSE"),
+    "AXP": ("Payments", "NYSE"),
+    "V": ("Payments", "NYSE"),
+    "MA": ("Payments", "NYSE"),
+    "COF": ("Banks", "NYSE"),
+    "USB": ("Banks", "NYSE"),
+    "PNC": ("Banks", "NYSE"),
+    "TFC": ("Banks", "NYSE"),
+    "BK": ("Asset Management", "NYSE"),
+    "STT": ("Asset Management", "NYSE"),
+    "MMC": ("Insurance", "NYSE"),
+    "SPGI": ("Exchanges & Data", "NYSE"),
+    "ICE": ("Exchanges & Data", "NYSE"),
+    "CME": ("Exchanges & Data", "NASDAQ"),
+    "NDAQ": ("Exchanges & Data", "NASDAQ"),
+    "MCO": ("Exchanges & Data", "NYSE"),
+    "FIS": ("Payments", "NYSE"),
+    "FISV": ("Payments", "NASDAQ"),
+    "GPN": ("Payments", "NYSE"),
+    "JKHY": ("Payments", "NASDAQ"),
+    "SYF": ("Banks", "NYSE"),
+    "ALLY": ("Banks", "NYSE"),
+    "RF": ("Banks", "NYSE"),
+    "KEY": ("Banks", "NYSE"),
+    "HBAN": ("Banks", "NASDAQ"),
+    "CFG": ("Banks", "NYSE"),
+    "MTB": ("Banks", "NYSE"),
+    "ZION": ("Banks", "NASDAQ"),
+    "FHN": ("Banks", "NYSE"),
+    "BKU": ("Banks", "NYSE"),
+    "WBS": ("Banks", "NYSE"),
+    "SNV": ("Banks", "NYSE"),
+    "PG": ("Household Products", "NYSE"),
+    "KO": ("Food & Beverage", "NYSE"),
+    "PEP": ("Food & Beverage", "NASDAQ"),
+    "WMT": ("Retail", "NYSE"),
+    "COST": ("Retail", "NASDAQ"),
+    "TGT": ("Retail", "NYSE"),
+    "HD": ("Retail", "NYSE"),
+    "LOW": ("Retail", "NYSE"),
+    "NKE": ("Apparel", "NYSE"),
+    "MCD": ("Restaurants", "NYSE"),
+    "SBUX": ("Restaurants", "NASDAQ"),
+    "CMCSA": ("Media", "NASDAQ"),
+    "T": ("Telecom", "NYSE"),
+    "VZ": ("Telecom", "NYSE"),
+    "TMUS": ("Telecom", "NASDAQ"),
+    "CHTR": ("Media", "NASDAQ"),
+    "ATVI": ("Media", "NASDAQ"),
+    "EA": ("Media", "NASDAQ"),
+    "TTWO": ("Media", "NASDAQ"),
+    "LULU": ("Apparel", "NASDAQ"),
+    "ULTA": ("Retail", "NASDAQ"),
+    "ROST": ("Retail", "NASDAQ"),
+    "TJX": ("Retail", "NYSE"),
+    "DG": ("Retail", "NYSE"),
+    "DLTR": ("Retail", "NASDAQ"),
+    "FIVE": ("Retail", "NASDAQ"),
+    "BURL": ("Retail", "NYSE"),
+    "CASY": ("Retail", "NASDAQ"),
+    "KR": ("Retail", "NYSE"),
+    "SYY": ("Food & Beverage", "NYSE"),
+    "HSY": ("Food & Beverage", "NYSE"),
+    "K": ("Food & Beverage", "NYSE"),
+    "GIS": ("Food & Beverage", "NYSE"),
+    "CPB": ("Food & Beverage", "NYSE"),
+    "KHC": ("Food & Beverage", "NASDAQ"),
+    "MDLZ": ("Food & Beverage", "NASDAQ"),
+    "STZ": ("Food & Beverage", "NYSE"),
+    "BF.B": ("Food & Beverage", "NYSE"),
+    "MO": ("Tobacco", "NYSE"),
+    "F": ("Autos", "NYSE"),
+    "GM": ("Autos", "NYSE"),
+    "BA": ("Aerospace & Defense", "NYSE"),
+    "CAT": ("Machinery", "NYSE"),
+    "GE": ("Aerospace & Defense", "NYSE"),
+    "HON": ("Conglomerates", "NASDAQ"),
+    "UPS": ("Transportation", "NYSE"),
+    "FDX": ("Transportation", "NYSE"),
+    "RTX": ("Aerospace & Defense", "NYSE"),
+    "LMT": ("Aerospace & Defense", "NYSE"),
+    "GD": ("Aerospace & Defense", "NYSE"),
+    "NOC": ("Aerospace & Defense", "NYSE"),
+    "DE": ("Machinery", "NYSE"),
+    "EMR": ("Electrical Equipment", "NYSE"),
+    "ITW": ("Machinery", "NYSE"),
+    "ETN": ("Electrical Equipment", "NYSE"),
+    "ROK": ("Electrical Equipment", "NYSE"),
+    "TT": ("Machinery", "NYSE"),
+    "CPRT": ("Commercial Services", "NASDAQ"),
+    "CSX": ("Transportation", "NASDAQ"),
+    "UNP": ("Transportation", "NYSE"),
+    "NSC": ("Transportation", "NYSE"),
+    "PCAR": ("Machinery", "NASDAQ"),
+    "WM": ("Environmental Services", "NYSE"),
+    "RSG": ("Environmental Services", "NYSE"),
+    "WCN": ("Environmental Services", "NYSE"),
+    "AWK": ("Utilities", "NYSE"),
+    "AEP": ("Utilities", "NASDAQ"),
+    "DUK": ("Utilities", "NYSE"),
+    "SO": ("Utilities", "NYSE"),
+    "NEE": ("Utilities", "NYSE"),
+    "D": ("Utilities", "NYSE"),
+    "EXC": ("Utilities", "NASDAQ"),
+    "SRE": ("Utilities", "NYSE"),
+    "XEL": ("Utilities", "NASDAQ"),
+    "WEC": ("Utilities", "NYSE"),
+    "ES": ("Utilities", "NYSE"),
+    "EIX": ("Utilities", "NYSE"),
+    "PEG": ("Utilities", "NYSE"),
+    "AEE": ("Utilities", "NYSE"),
+    "LNT": ("Utilities", "NASDAQ"),
+    "ED": ("Utilities", "NYSE"),
+    "XOM": ("Oil & Gas", "NYSE"),
+    "CVX": ("Oil & Gas", "NYSE"),
+    "COP": ("Oil & Gas", "NYSE"),
+    "SLB": ("Oilfield Services", "NYSE"),
+    "EOG": ("Oil & Gas", "NYSE"),
+    "PSX": ("Refining", "NYSE"),
+    "MPC": ("Refining", "NYSE"),
+    "VLO": ("Refining", "NYSE"),
+    "KMI": ("Midstream", "NYSE"),
+    "WMB": ("Midstream", "NYSE"),
+    "OXY": ("Oil & Gas", "NYSE"),
+    "HAL": ("Oilfield Services", "NYSE"),
+    "BKR": ("Oilfield Services", "NASDAQ"),
+    "FANG": ("Oil & Gas", "NASDAQ"),
+    "PXD": ("Oil & Gas", "NYSE"),
+    "EQT": ("Oil & Gas", "NYSE"),
+    "DVN": ("Oil & Gas", "NYSE"),
+    "MTDR": ("Oil & Gas", "NYSE"),
+    "MRO": ("Oil & Gas", "NYSE"),
+    "APA": ("Oil & Gas", "NASDAQ"),
+    "OKE": ("Midstream", "NYSE"),
+    "TRP": ("Midstream", "NYSE"),
+    "ENB": ("Midstream", "NYSE"),
+    "EPD": ("Midstream", "NYSE"),
+    "ET": ("Midstream", "NYSE"),
+    "MPLX": ("Midstream", "NYSE"),
+    "PAA": ("Midstream", "NASDAQ"),
+    "LNG": ("Midstream", "NYSE"),
+    "NOV": ("Oilfield Services", "NYSE"),
+    "FTI": ("Oilfield Services", "NYSE"),
+    "NBR": ("Oilfield Services", "NYSE"),
+    "HP": ("Oilfield Services", "NYSE"),
+    "PTEN": ("Oilfield Services", "NASDAQ"),
+    "PUMP": ("Oilfield Services", "NYSE"),
+    "WFRD": ("Oilfield Services", "NASDAQ"),
+    "TDW": ("Oilfield Services", "NYSE"),
+    "RIG": ("Oilfield Services", "NYSE"),
+    "VAL": ("Oilfield Services", "NYSE"),
+}
+
+SymbolRecord = namedtuple(
+    "SymbolRecord", ["id", "symbol", "name", "sector", "industry", "exchange"]
+)
+
+
+def company_name(ticker, sector):
+    """Get or generate a company name for a ticker"""
+    if ticker in KNOWN_NAMES:
+        return KNOWN_NAMES[ticker]
+
+    # Generate a realistic name based on ticker and sector; the keyword is
+    # picked from the ticker itself so the name is the same in every process
+    keywords = SECTOR_KEYWORDS.get(sector, ["Corp.", "Inc."])
+    keyword = keywords[zlib.crc32(ticker.encode()) % len(keywords)]
+
+    # Try to make it sound like a real company
+    if ticker.isalpha() and len(ticker) <= 4:
+        return f"{ticker} {keyword}"
+    else:
+        return f"{ticker} Corporation"
+
+
+def industry_of(ticker, sector):
+    """Sub-sector for a ticker; unknown tickers get one from their own hash"""
+    if ticker in TICKER_PROFILES:
+        return TICKER_PROFILES[ticker][0]
+    industries = SECTOR_INDUSTRIES.get(sector, ["Other"])
+    return industries[zlib.crc32(ticker.encode(), 1) % len(industries)]
+
+
+def exchange_of(ticker):
+    """Listing exchange for a ticker; unknown tickers get one from their own hash"""
+    if ticker in TICKER_PROFILES:
+        return TICKER_PROFILES[ticker][1]
+    return EXCHANGES[zlib.crc32(ticker.encode(), 2) % len(EXCHANGES)]
+
+
+class SymbolMaster:
+    """Ticker -> (ID, name, sector, industry, exchange) reference with a hash index
+
+    IDs are assigned in insertion order. Membership and lookups are O(1)
+    dict probes, and adding a ticker that is already present returns its
+    existing ID, so every ticker appears exactly once.
+    """
+
+    def __init__(self):
+        self._index = {}
+        self.symbols = []
+        self.names = []
+        self.sectors = []
+        self.industries = []
+        self.exchanges = []
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def __contains__(self, symbol):
+        return symbol in self._index
+
+    def __iter__(self):
+        return iter(self.symbols)
+
+    def add(self, symbol, sector, name=None):
+        """Register a ticker and return its ID; duplicates keep the first entry"""
+        existing = self._index.get(symbol)
+        if existing is not None:
+            return existing
+        symbol_id = len(self.symbols)
+        self._index[symbol] = symbol_id
+        self.symbols.append(symbol)
+        self.sectors.append(sector)
+        self.names.append(company_name(symbol, sector) if name is None else name)
+        self.industries.append(industry_of(symbol, sector))
+        self.exchanges.append(exchange_of(symbol))
+        return symbol_id
+
+    def id_of(self, symbol):
+        """ID of a ticker, or None if it isn't in the master"""
+        return self._index.get(symbol)
+
+    def get(self, symbol):
+        """Full record for a ticker, or None"""
+        symbol_id = self._index.get(symbol)
+        if symbol_id is None:
+            return None
+        return SymbolRecord(
+            symbol_id,
+            symbol,
+            self.names[symbol_id],
+            self.sectors[symbol_id],
+            self.industries[symbol_id],
+            self.exchanges[symbol_id],
+        )
+
+    def frame(self):
+        """The master as a DataFrame, one column per record field"""
+        return pd.DataFrame(
+            {
+                "ID": range(len(self.symbols)),
+                "Symbol": self.symbols,
+                "Name": self.names,
+                "Sector": self.sectors,
+                "Industry": self.industries,
+                "Exchange": self.exchanges,
+            }
+        )
+
+
+@lru_cache(maxsize=None)
+def get_symbol_master():
+    """The process-wide master of real tickers, built on first use"""
+    master = SymbolMaster()
+    for sector, tickers in SECTOR_TICKERS.items():
+        for ticker in tickers:
+            master.add(ticker, sector)
+    for ticker, sector in ADDITIONAL_TICKERS.items():
+        master.add(ticker, sector)
+    return master
@@ -0,0 +1,11 @@
+# tests/conftest.py
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# Published universes go to a scratch directory, not the working tree
+os.environ.setdefault("SCANNER_SNAPSHOT_DIR", tempfile.mkdtemp(prefix="snapshots-"))
@@ -0,0 +1,61 @@
+# tests/test_app.py
+import io
+import threading
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from conftest import ROOT
+
+CHART_VIEWS = [
+    "📊 Sector Heatmap",
+    "📈 Market Cap vs % From Low",
+    "🏭 Sector Breakdown",
+]
+
+
+@pytest.fixture(scope="module")
+def scanned_app():
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=120).run()
+    at.button(key="run_scan").click().run()
+    assert not at.exception
+    assert "Scan complete" in at.success[0].value
+    return at
+
+
+@pytest.mark.parametrize("view", CHART_VIEWS)
+@pytest.mark.parametrize("exchanges", [[], ["NYSE"]])
+def test_chart_views_build(scanned_app, view, exchanges):
+    at = scanned_app
+    at.multiselect(key="exchange_filter").set_value(exchanges).run()
+    at.button(key="run_scan").click().run()
+    assert "Scan complete" in at.success[0].value
+    at.radio(key="chart_view").set_value(view).run()
+    assert not at.exception
+    assert view in [s.value for s in at.subheader]
+
+
+def test_export_is_prepared_once_as_a_buffer(scanned_app):
+    at = scanned_app
+    at.button(key="run_scan").click().run()
+    at.button(key="prepare_export").click().run()
+
+    assert not at.exception
+    assert isinstance(at.session_state["export"][1], io.BytesIO)
+    assert len(at.get("download_button")) == 1
+
+
+def feed_threads():
+    return [t for t in threading.enumerate() if t.name == "market-feed"]
+
+
+def test_live_feed_stops_when_toggled_off():
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=120).run()
+    at.toggle(key="live_feed").set_value(True).run()
+    at.button(key="run_scan").click().run()
+    assert not at.exception
+    assert len(feed_threads()) == 1
+
+    at.toggle(key="live_feed").set_value(False).run()
+    assert not at.exception
+    assert feed_threads() == []
@@ -0,0 +1,69 @@
+# tests/test_backtest.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest import run_backtest
+from price_history import generate_universe_with_history
+
+WINDOW = 20
+HORIZONS = (1, 5)
+
+
+@pytest.fixture(scope="module")
+def history():
+    return generate_universe_with_history(n_stocks=60, n_days=90, seed=5)
+
+
+def naive_backtest(closes, dates, eligible, threshold):
+    """One date at a time from pandas rolling lows"""
+    lows = pd.DataFrame(closes).rolling(WINDOW).min().to_numpy()
+    rows = []
+    for day in range(WINDOW - 1, len(closes)):
+        from_low = np.round((closes[day] - lows[day]) / lows[day] * 100, 1)
+        signal = (from_low <= threshold) & eligible
+        row = {"Signals": signal.sum()}
+        for h in HORIZONS:
+            returns = (
+                closes[day + h, signal] / closes[day, signal] - 1
+                if day + h < len(closes)
+                else np.empty(0)
+            )
+            row[f"Fwd {h}D Count"] = len(returns)
+            row[f"Fwd {h}D Return (%)"] = (
+                returns.mean() * 100 if len(returns) else np.nan
+            )
+            row[f"Fwd {h}D Win Rate (%)"] = (
+                (returns > 0).mean() * 100 if len(returns) else np.nan
+            )
+        rows.append(row)
+    return pd.DataFrame(rows, index=pd.Index(dates[WINDOW - 1 :], name="Date"))
+
+
+@pytest.mark.parametrize("workers, chunk_days", [(1, 7), (1, 1000), (2, 16)])
+def test_matches_day_by_day_replay(history, workers, chunk_days):
+    universe, dates, closes = history
+    daily = run_backtest(
+        closes,
+        dates,
+        universe,
+        min_volume=5.0,
+        threshold=8.0,
+        window=WINDOW,
+        horizons=HORIZONS,
+        workers=workers,
+        chunk_days=chunk_days,
+    )
+    eligible = (universe["Volume (M)"] >= 5.0).to_numpy()
+    expected = naive_backtest(closes, dates, eligible, 8.0)
+
+    assert daily["Signals"].sum() > 0
+    pd.testing.assert_frame_equal(
+        daily, expected[daily.columns], check_dtype=False, rtol=1e-9
+    )
+
+
+def test_too_little_history_is_an_error(history):
+    universe, dates, closes = history
+    with pytest.raises(ValueError, match="at least"):
+        run_backtest(closes[:10], dates[:10], universe, window=WINDOW)
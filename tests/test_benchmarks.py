@@ -0,0 +1,18 @@
+# tests/test_benchmarks.py
+import benchmarks
+
+
+def test_only_skips_setup_of_other_cases(monkeypatch):
+    def no_scanner(*args, **kwargs):
+        raise AssertionError("Scanner built for an unselected case")
+
+    monkeypatch.setattr(benchmarks, "Scanner", no_scanner)
+    results = benchmarks.run_suite(
+        [500], repeat=1, only=["nsmallest"], log=lambda line: None
+    )
+    assert [r["case"] for r in results] == ["nsmallest"]
+
+
+def test_every_case_runs():
+    results = benchmarks.run_suite([500], repeat=1, log=lambda line: None)
+    assert len(results) == len(list(benchmarks.suite_cases(500)))
@@ -0,0 +1,55 @@
+# tests/test_bitmap_index.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from bitmap_index import BitmapIndex, bitmap_rows, bitmap_test, popcount
+from data_generator import generate_stock_universe
+from scanner import Scanner
+
+
+@pytest.fixture(scope="module")
+def universe():
+    return generate_stock_universe(n_stocks=10_003)
+
+
+@pytest.mark.parametrize(
+    "labels", [[], ["Technology"], ["Energy", "Utilities", "Unknown"]]
+)
+def test_select_matches_isin(universe, labels):
+    index = BitmapIndex.from_column(universe["Sector"])
+    expected = universe["Sector"].isin(labels).to_numpy()
+
+    bitmap = index.select(labels)
+    rows = bitmap_rows(bitmap, index.n_rows)
+
+    np.testing.assert_array_equal(rows, np.flatnonzero(expected))
+    assert popcount(bitmap) == expected.sum()
+    np.testing.assert_array_equal(
+        bitmap_test(bitmap, np.arange(index.n_rows)), expected
+    )
+
+
+def test_unrestricting_choices_select_nothing_to_filter():
+    index = BitmapIndex.from_column(pd.Series(["b", "a", "b", "c"]))
+
+    assert index.labels == ["a", "b", "c"]
+    assert index.codes.dtype == np.int8
+    assert index.select(None) is None
+    assert index.select(["c", "a", "b"]) is None
+
+
+def test_category_choices_match_masks(universe):
+    scanner = Scanner(universe)
+    sectors = scanner.sectors[:3]
+    exchanges = ["NASDAQ"]
+    expected = (
+        universe["Sector"].isin(sectors) & universe["Exchange"].isin(exchanges)
+    ).to_numpy()
+
+    rows = scanner.filter_rows(sectors, exchanges=exchanges)
+    np.testing.assert_array_equal(rows, np.flatnonzero(expected))
+
+    rows = scanner.filter_rows(sectors, min_volume=5.0, exchanges=exchanges)
+    expected &= (universe["Volume (M)"] >= 5.0).to_numpy()
+    np.testing.assert_array_equal(rows, np.flatnonzero(expected))
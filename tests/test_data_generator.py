@@ -0,0 +1,19 @@
+# tests/test_data_generator.py
+from data_generator import generate_stock_universe
+from symbol_master import get_symbol_master
+
+
+def test_default_universe_is_every_real_ticker():
+    master = get_symbol_master()
+    universe = generate_stock_universe()
+
+    assert len(universe) == len(master)
+    assert universe["Symbol"].tolist() == list(master.symbols)
+
+
+def test_larger_universe_pads_with_synthetic_tickers():
+    master = get_symbol_master()
+    universe = generate_stock_universe(n_stocks=len(master) + 100)
+
+    assert universe["Symbol"].iloc[: len(master)].tolist() == list(master.symbols)
+    assert universe["Symbol"].is_unique
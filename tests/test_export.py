@@ -0,0 +1,45 @@
+# tests/test_export.py
+import io
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from data_generator import generate_stock_universe
+from export import EXPORT_FORMATS, export_bytes, write_frame
+
+READERS = {
+    "csv": pd.read_csv,
+    "parquet": pd.read_parquet,
+    "arrow": lambda f: pa.ipc.open_file(f).read_all().to_pandas(),
+}
+
+
+@pytest.fixture(scope="module")
+def frame():
+    return generate_stock_universe(n_stocks=1_234)
+
+
+@pytest.mark.parametrize("fmt", list(EXPORT_FORMATS))
+def test_write_frame_round_trips_in_chunks(frame, fmt, tmp_path):
+    path = tmp_path / f"out.{fmt}"
+    write_frame(frame, path, fmt, chunk_rows=100)
+
+    pd.testing.assert_frame_equal(
+        READERS[fmt](path), frame, check_dtype=False, check_exact=False
+    )
+
+
+@pytest.mark.parametrize("fmt", list(EXPORT_FORMATS))
+def test_export_bytes_is_a_view_of_the_written_file(frame, fmt):
+    data = export_bytes(frame, fmt, chunk_rows=100)
+
+    assert isinstance(data, memoryview)
+    pd.testing.assert_frame_equal(
+        READERS[fmt](io.BytesIO(data)), frame, check_dtype=False, check_exact=False
+    )
+
+
+def test_unknown_format_is_rejected(frame):
+    with pytest.raises(ValueError):
+        write_frame(frame, io.BytesIO(), "xlsx")
@@ -0,0 +1,42 @@
+# tests/test_market_feed.py
+import socket
+import time
+
+from data_generator import generate_stock_universe
+from market_feed import LiveFeed, SharedFeed
+
+
+def wait_for(condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+
+
+def test_stop_closes_server_and_thread():
+    feed = LiveFeed.start(generate_stock_universe(n_stocks=200), flush_interval=0.05)
+    wait_for(lambda: feed.snapshot()[0] > 0)
+    port = feed.server.port
+
+    feed.stop()
+
+    assert not feed.running
+    assert feed._loop.is_closed()
+    with socket.socket() as s:
+        assert s.connect_ex(("127.0.0.1", port)) != 0
+
+
+def test_shared_feed_stops_after_last_subscriber():
+    shared = SharedFeed(lambda: generate_stock_universe(n_stocks=200))
+    first = shared.subscribe("a")
+    assert shared.subscribe("b") is first
+
+    shared.unsubscribe("a")
+    assert first.running
+    shared.unsubscribe("b")
+    assert not first.running and shared.feed is None
+
+    second = shared.subscribe("a")
+    assert second.running and second.id != first.id
+    shared.unsubscribe("a")
+    assert not second.running
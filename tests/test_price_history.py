@@ -0,0 +1,28 @@
+# tests/test_price_history.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from price_history import generate_price_history, rolling_max, rolling_min
+
+
+@pytest.fixture(scope="module")
+def closes():
+    end_prices = np.random.default_rng(3).uniform(5, 500, 40)
+    return generate_price_history(end_prices, n_days=300, seed=3)
+
+
+@pytest.mark.parametrize("window", [1, 2, 7, 64, 252, 300, 1000])
+def test_rolling_extremes_match_pandas(closes, window):
+    expected = pd.DataFrame(closes).rolling(window, min_periods=1)
+
+    np.testing.assert_array_equal(rolling_min(closes, window), expected.min())
+    np.testing.assert_array_equal(rolling_max(closes, window), expected.max())
+
+
+def test_history_ends_at_the_given_prices():
+    end_prices = np.array([10.0, 250.5, 3.25])
+    closes = generate_price_history(end_prices, n_days=50)
+
+    assert closes.shape == (50, 3)
+    np.testing.assert_allclose(closes[-1], end_prices)
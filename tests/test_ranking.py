@@ -0,0 +1,30 @@
+# tests/test_ranking.py
+import numpy as np
+import pytest
+
+from data_generator import generate_stock_universe
+from ranking import RANKINGS, Ranker, top_k
+
+
+@pytest.mark.parametrize("k", [0, 1, 5, 37, 999, 1000, 5000])
+def test_top_k_matches_stable_argsort(k):
+    # Few distinct values, so most of the k-th value's rows are ties
+    values = np.random.default_rng(k).integers(0, 20, 1000).astype(np.float32)
+
+    np.testing.assert_array_equal(
+        top_k(values, k), np.argsort(values, kind="stable")[:k]
+    )
+
+
+@pytest.mark.parametrize("ranking", list(RANKINGS))
+def test_ranker_top_is_the_lowest_scores(ranking):
+    universe = generate_stock_universe(n_stocks=2_000)
+    ranker = Ranker.from_universe(universe, RANKINGS[ranking])
+    score = sum(
+        universe[column].to_numpy() * weight / ranker.scales[column]
+        for column, weight in RANKINGS[ranking].items()
+    )
+
+    top = ranker.top(universe, 25)
+
+    assert top.index.tolist() == np.argsort(score, kind="stable")[:25].tolist()
@@ -0,0 +1,44 @@
+# tests/test_scan_cache.py
+import pandas as pd
+
+from scan_cache import ScanCache, _nbytes, scan_key
+
+
+def result(rows):
+    frame = pd.DataFrame({"% From Low": [1.0] * rows})
+    return frame, frame.iloc[:0]
+
+
+def test_least_recently_used_entry_is_evicted_first():
+    cache = ScanCache(max_entries=2)
+    cache.put("a", result(1))
+    cache.put("b", result(1))
+    assert cache.get("a") is not None
+
+    cache.put("c", result(1))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_memory_cap_evicts_and_skips_oversized_results():
+    size = _nbytes(result(100))
+    cache = ScanCache(max_bytes=2 * size)
+    for key in "abc":
+        cache.put(key, result(100))
+
+    assert len(cache) == 2 and cache.nbytes == 2 * size
+    assert cache.get("a") is None
+
+    cache.put("huge", result(1000))
+    assert cache.get("huge") is None and len(cache) == 2
+
+
+def test_scan_key_ignores_label_order_and_number_types():
+    assert scan_key(1, ["Tech", "Energy"], 10, 200, 5, 5) == scan_key(
+        1, ["Energy", "Tech"], 10.0, 200.0, 5.0, 5.0
+    )
+    assert scan_key(1, [], 0, 1, 0, 1, exchanges=["NYSE"]) != scan_key(
+        1, [], 0, 1, 0, 1
+    )
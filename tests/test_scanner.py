@@ -0,0 +1,49 @@
+# tests/test_scanner.py
+import numpy as np
+import pytest
+
+from benchmarks import mask_scan
+from data_generator import generate_stock_universe
+from incremental_scan import IncrementalScan
+from scanner import Scanner
+
+
+@pytest.fixture(scope="module", params=[False, True], ids=["float64", "compact"])
+def universe(request):
+    return generate_stock_universe(n_stocks=200_000, compact=request.param)
+
+
+# Bounds float32 cannot represent exactly
+INEXACT_FILTERS = pytest.mark.parametrize(
+    "min_cap, max_cap, min_volume, threshold",
+    [(10.0, 200.0, 5.0, 4.9), (0.3, 123.4, 2.7, 0.3), (10.1, 499.9, 0.1, 7.7)],
+)
+
+
+@INEXACT_FILTERS
+def test_scan_matches_mask_scan(universe, min_cap, max_cap, min_volume, threshold):
+    sectors = sorted(universe["Sector"].unique())
+    filters = (min_cap, max_cap, min_volume, threshold)
+    filtered_df, near_low_df = Scanner(universe).scan(sectors, *filters)
+    expected_filtered, expected_near = mask_scan(universe, sectors, *filters)
+
+    assert filtered_df.index.equals(expected_filtered.index)
+    assert (filtered_df["Near Low"] == expected_filtered["Near Low"]).all()
+    assert filtered_df["Near Low"].sum() == len(near_low_df)
+    assert sorted(near_low_df.index) == sorted(expected_near.index)
+    assert np.all(np.diff(near_low_df["% From Low"].to_numpy()) >= 0)
+
+
+@INEXACT_FILTERS
+def test_incremental_scan_matches_scan(
+    universe, min_cap, max_cap, min_volume, threshold
+):
+    scanner = Scanner(universe)
+    filters = (scanner.sectors, min_cap, max_cap, min_volume, threshold)
+    filtered_df, near_low_df = scanner.scan(*filters)
+    live_scan = IncrementalScan.from_scanner(scanner, scanner.universe, *filters)
+    live_filtered, live_near = live_scan.results(scanner.universe)
+
+    assert live_filtered.index.equals(filtered_df.index)
+    assert (live_filtered["Near Low"] == filtered_df["Near Low"]).all()
+    assert live_near.index.equals(near_low_df.index)
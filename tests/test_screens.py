@@ -0,0 +1,57 @@
+# tests/test_screens.py
+import numpy as np
+import pytest
+
+from data_generator import generate_stock_universe
+from scanner import Scanner
+from screens import SCREENS, screen
+
+FILTERS = dict(min_cap=10.0, max_cap=200.0, min_volume=5.0)
+THRESHOLDS = dict(low_threshold=4.9, high_threshold=3.0, range_fraction=0.1)
+
+
+@pytest.fixture(scope="module", params=[False, True], ids=["float64", "compact"])
+def scanner(request):
+    return Scanner(generate_stock_universe(n_stocks=50_000, compact=request.param))
+
+
+def expected_screens(df):
+    """Each screen as its own set of masks over the whole universe"""
+    price, low, high = (
+        df[c].to_numpy() for c in ("Current Price", "52W Low", "52W High")
+    )
+    span = high - low
+    position = np.divide(price - low, span, out=np.zeros(len(df)), where=span > 0)
+    prefilter = (
+        (df["Market Cap (B)"] >= FILTERS["min_cap"])
+        & (df["Market Cap (B)"] <= FILTERS["max_cap"])
+        & (df["Volume (M)"] >= FILTERS["min_volume"])
+    ).to_numpy()
+    masks = {
+        "near_low": df["% From Low"].to_numpy() <= THRESHOLDS["low_threshold"],
+        "near_high": df["% From High"].to_numpy() >= -THRESHOLDS["high_threshold"],
+        "low_decile": position <= THRESHOLDS["range_fraction"],
+        "new_low": price <= low,
+    }
+    keys = {
+        "near_low": df["% From Low"].to_numpy(),
+        "near_high": -df["% From High"].to_numpy(),
+        "low_decile": position,
+        "new_low": df["% From Low"].to_numpy(),
+    }
+    return {
+        name: (np.flatnonzero(prefilter & masks[name]), keys[name]) for name in SCREENS
+    }
+
+
+@pytest.mark.parametrize("block_rows", [1_000, 1_000_000])
+def test_one_pass_matches_separate_masks(scanner, block_rows):
+    hits = screen(
+        scanner, scanner.sectors, **FILTERS, **THRESHOLDS, block_rows=block_rows
+    )
+
+    assert len(hits["near_low"].rows) > 0
+    for name, (rows, key) in expected_screens(scanner.universe).items():
+        np.testing.assert_array_equal(hits[name].rows, rows)
+        best = rows[np.argsort(key[rows], kind="stable")[:20]]
+        np.testing.assert_array_equal(hits[name].top(20), best)
@@ -0,0 +1,92 @@
+# tests/test_shared_universe.py
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+import pyarrow as pa
+
+from data_generator import generate_stock_universe
+from shared_universe import (
+    SharedUniverse,
+    _point_to,
+    _write_version,
+    attach,
+    current_version,
+    publish,
+)
+from scanner import Scanner
+from snapshot import load_universe
+
+
+def _mapped_ranges(path):
+    """Address ranges where this process maps ``path``"""
+    ranges = []
+    with open("/proc/self/maps") as maps:
+        for line in maps:
+            if line.rstrip().endswith(str(path)):
+                start, stop = line.split()[0].split("-")
+                ranges.append((int(start, 16), int(stop, 16)))
+    return ranges
+
+
+def test_attach_maps_strings_without_copying(tmp_path):
+    universe = load_universe(n_stocks=2_000, compact=True)
+    version = publish(universe, "u", tmp_path)
+    scanner = attach("u", version, tmp_path)
+
+    ranges = _mapped_ranges(tmp_path / f"u-v{version:06d}.arrow")
+    assert ranges
+    for column in ("Symbol", "Name"):
+        values = scanner.universe[column]
+        assert isinstance(values.dtype, pd.ArrowDtype)
+        data = pa.array(values.array).buffers()[-1]
+        assert any(lo <= data.address < hi for lo, hi in ranges), column
+    pd.testing.assert_frame_equal(
+        scanner.universe, universe, check_dtype=False, check_categorical=False
+    )
+
+
+def test_pointer_only_moves_forward(tmp_path):
+    universe = generate_stock_universe(n_stocks=500)
+    assert publish(universe, "u", tmp_path) == 1
+
+    # Two publishers claim versions 2 and 3; the one with version 2 finishes last
+    older = _write_version(universe, "u", tmp_path)
+    newer = _write_version(universe, "u", tmp_path)
+    _point_to("u", *newer, tmp_path)
+    _point_to("u", *older, tmp_path)
+
+    assert (older[0], newer[0]) == (2, 3)
+    assert current_version("u", tmp_path) == 3
+    assert attach("u", directory=tmp_path).version == "u-v3"
+
+
+def _attach_or_publish(directory):
+    return SharedUniverse.attach_or_publish(n_stocks=500, directory=directory).version
+
+
+def test_concurrent_attach_or_publish_publishes_once(tmp_path):
+    with ProcessPoolExecutor(4) as pool:
+        versions = list(pool.map(_attach_or_publish, [tmp_path] * 8))
+
+    assert versions == [1] * 8
+    assert len(list(tmp_path.glob("*.arrow"))) == 1
+
+
+def test_attach_reads_every_chunk_of_the_index(tmp_path):
+    universe = generate_stock_universe(n_stocks=3_000)
+    version = publish(universe, "u", tmp_path)
+    path = tmp_path / f"u-v{version:06d}.arrow"
+    with pa.memory_map(str(path)) as source:
+        table = pa.ipc.open_file(source).read_all()
+    # Rewrite the file as several record batches
+    rewritten = path.with_suffix(".tmp")
+    with pa.OSFile(str(rewritten), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=1_000)
+    os.replace(rewritten, path)
+
+    scanner = attach("u", version, tmp_path)
+    expected = Scanner(universe).index_arrays()
+    for key, array in scanner.index_arrays().items():
+        assert (array == expected[key]).all(), key
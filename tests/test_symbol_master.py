@@ -0,0 +1,48 @@
+# tests/test_symbol_master.py
+from symbol_master import (
+    ADDITIONAL_TICKERS,
+    SECTOR_TICKERS,
+    TICKER_PROFILES,
+    SymbolMaster,
+    exchange_of,
+    get_symbol_master,
+    industry_of,
+)
+
+
+def test_adding_a_known_ticker_keeps_the_first_entry():
+    master = SymbolMaster()
+    first = master.add("AAPL", "Technology", "Apple Inc.")
+    master.add("MSFT", "Technology")
+
+    assert master.add("AAPL", "Consumer Discretionary", "Other") == first
+    assert len(master) == 2
+    assert master.get("AAPL").sector == "Technology"
+    assert master.get("AAPL").name == "Apple Inc."
+    assert master.id_of("NOPE") is None and "NOPE" not in master
+
+
+def test_tickers_listed_twice_appear_once():
+    listed = [t for tickers in SECTOR_TICKERS.values() for t in tickers]
+    listed += list(ADDITIONAL_TICKERS)
+    master = get_symbol_master()
+
+    assert len(listed) > len(set(listed))
+    assert list(master.symbols) == list(dict.fromkeys(listed))
+
+
+def test_real_tickers_have_their_real_industry_and_exchange():
+    master = get_symbol_master()
+
+    assert set(master.symbols) <= set(TICKER_PROFILES)
+    assert master.get("KO").industry == "Food & Beverage"
+    assert master.get("MSFT").exchange == "NASDAQ"
+    assert (master.get("XOM").industry, master.get("XOM").exchange) == (
+        "Oil & Gas",
+        "NYSE",
+    )
+
+
+def test_synthetic_tickers_are_hashed_deterministically():
+    assert industry_of("QZXWB", "Energy") == industry_of("QZXWB", "Energy")
+    assert exchange_of("QZXWB") in ("NYSE", "NASDAQ")
@@ -0,0 +1,36 @@
+# tests/test_tick_updater.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_generator import generate_stock_universe
+from tick_updater import WeekLowHighTracker
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_patched_frame_matches_full_frame(compact):
+    universe = generate_stock_universe(n_stocks=5_000, compact=compact)
+    tracker = WeekLowHighTracker(universe, as_of="2024-01-01")
+    frame = tracker.to_frame()
+    rng = np.random.default_rng(0)
+    for step in range(5):
+        rows = np.unique(rng.integers(0, len(universe), 200))
+        prices = tracker.last[rows] * np.exp(rng.normal(0, 0.2, len(rows)))
+        stamp = pd.Timestamp("2024-01-02").value + step
+        tracker.update_extremes(rows, prices, prices, prices, np.full(len(rows), stamp))
+        frame = tracker.to_frame(rows, previous=frame)
+
+    pd.testing.assert_frame_equal(frame, tracker.to_frame())
+
+
+def test_untouched_rows_keep_seeded_extremes():
+    universe = generate_stock_universe(n_stocks=500)
+    tracker = WeekLowHighTracker(universe, as_of="2024-01-01")
+    low = universe.loc[0, "52W Low"]
+    tracker.update(universe.loc[0, "Symbol"], low * 1.01, "2024-01-02")
+
+    assert tracker.low[0] == low
+    assert len(tracker._min_q) == 1
+    # A year after the seed, the universe's own low has left the window
+    tracker.update(universe.loc[0, "Symbol"], low * 1.02, "2025-01-03")
+    assert tracker.low[0] == pytest.approx(low * 1.02)
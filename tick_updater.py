@@ -0,0 +1,187 @@
+# tick_updater.py
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+WINDOW = pd.Timedelta(weeks=52)
+
+
+def _to_ns(ts):
+    """Timestamp-like value as integer nanoseconds"""
+    return pd.Timestamp(ts).value
+
+
+class WeekLowHighTracker:
+    """Keep 52-week low/high per symbol up to date from a stream of price ticks
+
+    Each symbol has a pair of monotonic deques over the trailing window: the
+    min deque holds strictly increasing prices and the max deque strictly
+    decreasing ones, so the front of each is the current low/high. A tick
+    pushes once and pops whatever it dominates or whatever fell out of the
+    window, which is O(1) amortized per tick. A row's deques are created
+    when it first ticks, so untouched rows cost nothing.
+    """
+
+    def __init__(self, universe, window=WINDOW, as_of=None):
+        self.universe = universe.reset_index(drop=True)
+        self.window = pd.Timedelta(window).value
+        # Built back to front so a repeated symbol maps to its first row
+        symbols = self.universe["Symbol"].to_numpy(dtype=object).tolist()
+        self._rows = dict(zip(reversed(symbols), range(len(symbols) - 1, -1, -1)))
+
+        self._base_price = self.universe["Current Price"].to_numpy(np.float64)
+        self.last = self._base_price.copy()
+        self.low = self.universe["52W Low"].to_numpy(np.float64).copy()
+        self.high = self.universe["52W High"].to_numpy(np.float64).copy()
+        self._min_q = {}
+        self._max_q = {}
+        self.ticks = 0
+
+        # Without a history, treat the universe's own low/high as observed now
+        self._seed_ts = None
+        if as_of is not False:
+            self._seed_ts = _to_ns(pd.Timestamp.now() if as_of is None else as_of)
+
+    @classmethod
+    def from_history(cls, universe, dates, closes, window=WINDOW):
+        """Build a tracker seeded with a daily closes panel (one column per row)
+
+        The deques are built directly from the panel: the min deque is every
+        in-window close strictly below all later closes (and the reverse for
+        the max deque), found with one reversed running min/max per column.
+        """
+        tracker = cls(universe, window=window, as_of=False)
+        stamps = np.array([_to_ns(d) for d in dates], dtype=np.int64)
+        closes = np.asarray(closes, dtype=np.float64)
+        in_window = stamps > stamps[-1] - tracker.window
+        stamps = stamps[in_window]
+        recent = closes[in_window]
+
+        later_min = np.minimum.accumulate(recent[::-1], axis=0)[::-1]
+        later_max = np.maximum.accumulate(recent[::-1], axis=0)[::-1]
+        keep_min = np.ones_like(recent, dtype=bool)
+        keep_max = np.ones_like(recent, dtype=bool)
+        keep_min[:-1] = recent[:-1] < later_min[1:]
+        keep_max[:-1] = recent[:-1] > later_max[1:]
+
+        for row in range(recent.shape[1]):
+            min_q, max_q = tracker._queues(row)
+            idx = np.flatnonzero(keep_min[:, row])
+            min_q.extend(zip(stamps[idx].tolist(), recent[idx, row].tolist()))
+            idx = np.flatnonzero(keep_max[:, row])
+            max_q.extend(zip(stamps[idx].tolist(), recent[idx, row].tolist()))
+
+        tracker.last[:] = recent[-1]
+        tracker.low[:] = later_min[0]
+        tracker.high[:] = later_max[0]
+        return tracker
+
+    def _queues(self, row):
+        """The row's min and max deques, created (and seeded) on first use"""
+        min_q = self._min_q.get(row)
+        if min_q is not None:
+            return min_q, self._max_q[row]
+        min_q = self._min_q[row] = deque()
+        max_q = self._max_q[row] = deque()
+        if self._seed_ts is not None:
+            min_q.append((self._seed_ts, self.low[row]))
+            max_q.append((self._seed_ts, self.high[row]))
+        return min_q, max_q
+
+    def _push(self, row, ts, price):
+        min_q, max_q = self._queues(row)
+
+        while min_q and min_q[-1][1] >= price:
+            min_q.pop()
+        min_q.append((ts, price))
+        while max_q and max_q[-1][1] <= price:
+            max_q.pop()
+        max_q.append((ts, price))
+
+        cutoff = ts - self.window
+        while min_q[0][0] <= cutoff:
+            min_q.popleft()
+        while max_q[0][0] <= cutoff:
+            max_q.popleft()
+
+        self.last[row] = price
+        self.low[row] = min_q[0][1]
+        self.high[row] = max_q[0][1]
+
+    def update(self, symbol, price, ts=None):
+        """Apply one tick; unknown symbols are ignored"""
+        row = self._rows.get(symbol)
+        if row is None:
+            return False
+        self._push(row, _to_ns(pd.Timestamp.now() if ts is None else ts), float(price))
+        self.ticks += 1
+        return True
+
+    def update_many(self, symbols, prices, ts=None):
+        """Apply a batch of ticks sharing one timestamp"""
+        stamp = pd.Timestamp.now() if ts is None else ts
+        return sum(self.update(s, p, stamp) for s, p in zip(symbols, prices))
+
+    def row_of(self, symbol):
+        """Universe row of ``symbol``, or -1 if it is not tracked"""
+        return self._rows.get(symbol, -1)
+
+    def update_extremes(self, rows, lows, highs, lasts, stamps, ticks=None):
+        """Apply coalesced ticks: per row, the low, high and last price of a batch
+
+        Pushing the batch low and high before the last price gives the same
+        52-week low/high as pushing every tick, except that the batch
+        extremes expire from the window up to one batch later.
+        """
+        for row, low, high, last, ts in zip(
+            np.asarray(rows).tolist(),
+            np.asarray(lows).tolist(),
+            np.asarray(highs).tolist(),
+            np.asarray(lasts).tolist(),
+            np.asarray(stamps).tolist(),
+        ):
+            self._push(row, ts, low)
+            self._push(row, ts, high)
+            self._push(row, ts, last)
+        self.ticks += len(rows) if ticks is None else ticks
+
+    def to_frame(self, rows=None, previous=None):
+        """Current state with the same columns as ``generate_stock_universe``
+
+        Given ``previous``, a frame this method returned earlier, and the
+        ``rows`` ticked since, only those rows are recomputed: the price
+        columns are copied from ``previous`` and patched, and the other
+        columns are shared with it rather than copied.
+        """
+        if previous is None:
+            rows = slice(None)
+            out = self.universe.copy()
+        else:
+            out = previous.copy(deep=False)
+        low = self.low[rows]
+        high = self.high[rows]
+        last = self.last[rows]
+
+        columns = {
+            "Current Price": np.round(last, 2),
+            "52W Low": np.round(low, 2),
+            "52W High": np.round(high, 2),
+            "% From Low": np.round((last - low) / low * 100, 1),
+            "% From High": np.round((last - high) / high * 100, 1),
+            # Shares outstanding don't move intraday, so cap scales with price
+            "Market Cap (B)": np.round(
+                self.universe["Market Cap (B)"].to_numpy()[rows]
+                * last
+                / self._base_price[rows],
+                2,
+            ),
+        }
+        for column, values in columns.items():
+            if previous is None:
+                out[column] = values
+            else:
+                patched = previous[column].to_numpy().copy()
+                patched[rows] = values
+                out[column] = patched
+        return out
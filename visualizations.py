@@ -1,16 +1,15 @@
 # visualizations.py
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 
 
-def create_heatmap_chart(filtered_df):
-    """Create sector heatmap visualization"""
-    heatmap_data = filtered_df.pivot_table(
-        values="% From Low", index="Sector", aggfunc="mean"
-    ).sort_values("% From Low")
+def create_heatmap_chart(sector_stats):
+    """Create sector heatmap visualization from ``SectorAggregates.frame()``"""
+    heatmap_data = sector_stats["Mean % From Low"].sort_values()
 
     fig = px.imshow(
-        [heatmap_data["% From Low"].values],
+        [heatmap_data.values],
         x=heatmap_data.index,
         y=["Avg % From Low"],
         color_continuous_scale="RdYlGn_r",
@@ -21,25 +20,92 @@ def create_heatmap_chart(filtered_df):
     return fig
 
 
-def create_scatter_chart(filtered_df, threshold):
-    """Create scatter plot visualization"""
-    fig = px.scatter(
-        filtered_df,
-        x="Market Cap (B)",
-        y="% From Low",
-        color="Near Low",
-        hover_name="Symbol",
-        hover_data=["Sector", "Current Price", "52W Low"],
-        color_discrete_map={True: "#EF4444", False: "#3B82F6"},
-        size="Volume (M)",
-        size_max=20,
-        labels={
-            "Market Cap (B)": "Market Cap (Billions)",
-            "% From Low": "% From 52-Week Low",
-            "Near Low": "Near 52W Low",
-        },
+# Above this many points the scatter switches to a WebGL trace
+SCATTER_WEBGL_POINTS = 5_000
+# Above this many points the rest of the universe is drawn as a binned density
+SCATTER_DENSITY_POINTS = 100_000
+SCATTER_DENSITY_BINS = (120, 60)
+
+SCATTER_LABELS = {
+    "Market Cap (B)": "Market Cap (Billions)",
+    "% From Low": "% From 52-Week Low",
+    "Near Low": "Near 52W Low",
+}
+
+
+def _density_scatter(filtered_df, bins):
+    """Binned counts of the non-near-low points plus the near-low points themselves"""
+    near = filtered_df["Near Low"].to_numpy()
+    x = filtered_df["Market Cap (B)"].to_numpy()
+    y = filtered_df["% From Low"].to_numpy()
+
+    counts, x_edges, y_edges = np.histogram2d(x[~near], y[~near], bins=bins)
+    counts = np.where(counts > 0, counts, np.nan)
+
+    fig = go.Figure(
+        go.Heatmap(
+            x=(x_edges[:-1] + x_edges[1:]) / 2,
+            y=(y_edges[:-1] + y_edges[1:]) / 2,
+            z=counts.T,
+            colorscale="Blues",
+            colorbar=dict(title="Stocks"),
+            hovertemplate="Cap %{x:.0f}B • %{y:.1f}% from low<br>%{z} stocks"
+            "<extra></extra>",
+            name="Other stocks",
+        )
     )
 
+    near_df = filtered_df[near]
+    fig.add_trace(
+        go.Scattergl(
+            x=near_df["Market Cap (B)"],
+            y=near_df["% From Low"],
+            mode="markers",
+            marker=dict(color="#EF4444", size=5),
+            text=near_df["Symbol"],
+            hovertemplate="%{text}<br>Cap %{x:.1f}B • %{y:.1f}% from low"
+            "<extra></extra>",
+            name="Near 52W Low",
+        )
+    )
+    fig.update_layout(
+        xaxis_title=SCATTER_LABELS["Market Cap (B)"],
+        yaxis_title=SCATTER_LABELS["% From Low"],
+    )
+    return fig
+
+
+def create_scatter_chart(
+    filtered_df,
+    threshold,
+    webgl_points=SCATTER_WEBGL_POINTS,
+    density_points=SCATTER_DENSITY_POINTS,
+):
+    """Create scatter plot visualization
+
+    Up to ``webgl_points`` rows are drawn as an SVG scatter, up to
+    ``density_points`` as a WebGL scatter, and beyond that the non-near-low
+    rows are binned into a density heatmap while near-low rows stay
+    individual points.
+    """
+    n_points = len(filtered_df)
+    if n_points > density_points:
+        fig = _density_scatter(filtered_df, SCATTER_DENSITY_BINS)
+    else:
+        fig = px.scatter(
+            filtered_df,
+            x="Market Cap (B)",
+            y="% From Low",
+            color="Near Low",
+            hover_name="Symbol",
+            hover_data=["Sector", "Current Price", "52W Low"],
+            color_discrete_map={True: "#EF4444", False: "#3B82F6"},
+            size="Volume (M)",
+            size_max=20,
+            labels=SCATTER_LABELS,
+            render_mode="webgl" if n_points > webgl_points else "svg",
+        )
+
     fig.add_hline(
         y=threshold,
         line_dash="dash",
@@ -51,9 +117,12 @@ def create_scatter_chart(filtered_df, threshold):
     return fig
 
 
-def create_sector_charts(near_low_df):
-    """Create sector breakdown charts"""
-    sector_analysis = near_low_df["Sector"].value_counts().reset_index()
+def create_sector_charts(sector_stats):
+    """Create sector breakdown charts from ``SectorAggregates.frame()``"""
+    near_counts = sector_stats["Near Low"]
+    sector_analysis = (
+        near_counts[near_counts > 0].sort_values(ascending=False).reset_index()
+    )
     sector_analysis.columns = ["Sector", "Count"]
 
     # Bar chart